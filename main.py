@@ -15,7 +15,7 @@ This is the main entry point that imports and runs the application.
 All application logic is organized in the src/ package:
 
     src/
-    ├── utils/       # Helper modules (paths, fonts)
+    ├── utils/       # Helper modules (paths, fonts, process, debug)
     ├── core/        # Business logic (settings, downloader, updater)
     └── ui/          # GUI components (app, dialogs, widgets)
 
@@ -26,12 +26,16 @@ Usage:
     InfinityDownloader.exe
 """
 
+import os
 import sys
 
 
 def main() -> None:
     """Application entry point."""
-    # Import here to ensure proper module loading after path setup
+    # Import here to ensure proper module loading after path setup.
+    # settings goes first: its import starts a background preload that
+    # overlaps with the (slow) customtkinter import below.
+    import src.core.settings  # noqa: F401
     from src.ui.app import InfinityMP3Downloader
     
     app = InfinityMP3Downloader()
@@ -39,6 +43,12 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # pythonw.exe / windowed builds have no console: give print() a sink
+    if sys.stdout is None:
+        sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    if sys.stderr is None:
+        sys.stderr = sys.stdout
+    
     # Handle post-update flag (from self-update process)
     if "--post-update" in sys.argv:
         print("✅ Update completed successfully!")
@@ -4,13 +4,24 @@ Core Package - Business Logic (Decoupled from GUI)
 
 from .settings import SettingsManager
 from .downloader import Downloader
-from .updater import (
-    run_full_update_routine,
-    UpdateResult,
-    VersionInfo,
-    check_ytdlp_update,
+
+# Updater names are resolved lazily (PEP 562) so importing the core
+# package does not pull in requests/zipfile at startup.
+_UPDATER_EXPORTS = (
+    "run_full_update_routine",
+    "UpdateResult",
+    "VersionInfo",
+    "check_ytdlp_update",
 )
 
+
+def __getattr__(name):
+    if name in _UPDATER_EXPORTS:
+        from . import updater
+        return getattr(updater, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "SettingsManager",
     "Downloader",
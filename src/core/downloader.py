@@ -15,13 +15,21 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
 import os
+import queue
 import re
+import sys
 import subprocess
+import threading
+import time
+import traceback
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Callable, Optional, List
+from typing import Callable, Iterator, Optional, List, Tuple
 
 from src.utils.paths import YTDLP_PATH, ENGINE_DIR
+from src.utils.process import POPEN_KWARGS
 
 
 @dataclass
@@ -33,6 +41,55 @@ class DownloadResult:
     error_code: Optional[int] = None
 
 
+# Precompiled yt-dlp output parsers (hot path: ~10 progress lines/sec)
+# Run on raw bytes so the common progress line needs no decode
+_RE_PROGRESS = re.compile(rb'\[download\]\s+(\d+\.?\d*)%')
+_RE_SPEED = re.compile(rb'at\s+(\S+/s)')
+_RE_ETA = re.compile(rb'ETA\s+(\S+)')
+_RE_DEST = re.compile(r'^\[(download|ExtractAudio)\] Destination:\s*(.+)$')
+
+
+# Cheap pre-check so obvious non-YouTube input never spawns yt-dlp
+_RE_YOUTUBE = re.compile(
+    r'^https?://(?:www\.|m\.|music\.)?'
+    r'(?:youtube\.com/(?:watch\?(?:.*&)?v=|shorts/|live/|playlist\?list=|embed/)|youtu\.be/)'
+    r'[\w\-]+',
+    re.IGNORECASE
+)
+
+
+def is_youtube_url(url: str) -> bool:
+    """
+    Check whether a string looks like a YouTube video/playlist URL.
+    
+    Args:
+        url: User-supplied URL
+        
+    Returns:
+        bool: True if the URL matches a known YouTube pattern
+    """
+    return _RE_YOUTUBE.match(url) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _aria2c_available() -> bool:
+    """
+    Check once per process whether aria2c is installed.
+    
+    Returns:
+        bool: True if `aria2c --version` runs successfully
+    """
+    try:
+        result = subprocess.run(
+            ["aria2c", "--version"],
+            capture_output=True,
+            **POPEN_KWARGS
+        )
+        return result.returncode == 0
+    except FileNotFoundError:
+        return False
+
+
 # Type aliases for callbacks
 ProgressCallback = Callable[[str, Optional[float]], None]  # (label, percentage)
 LogCallback = Callable[[str, str], None]  # (message, level)
@@ -70,7 +127,11 @@ class Downloader:
     """
     
     # High-precision regex to capture decimal progress
-    PROGRESS_REGEX = re.compile(r'\[download\]\s+(\d+\.?\d*)%')
+    PROGRESS_REGEX = _RE_PROGRESS
+    
+    # Progress decimation: report if pct moved >= 0.1 or 50ms passed
+    PROGRESS_MIN_DELTA: float = 0.1
+    PROGRESS_MIN_INTERVAL: float = 0.05
     
     def __init__(
         self,
@@ -98,6 +159,12 @@ class Downloader:
         
         self._process: Optional[subprocess.Popen] = None
         self._cancelled = False
+        self._last_pct: float = -1.0
+        self._last_pct_ts: float = 0.0
+        
+        # Only output dir and URL vary per download
+        self._use_aria2c_now: bool = use_aria2c and self._is_aria2c_available()
+        self._base_cmd: Tuple[str, ...] = self._build_base_command()
     
     def _report_progress(self, label: str, percentage: Optional[float] = None) -> None:
         """Send progress update via callback."""
@@ -109,18 +176,13 @@ class Downloader:
         if self.log_callback:
             self.log_callback(message, level)
     
-    def _build_command(self, url: str) -> List[str]:
+    def _build_base_command(self) -> Tuple[str, ...]:
         """
-        Build the yt-dlp command with optimized arguments.
+        Build the invariant part of the yt-dlp command (once per instance).
         
-        Args:
-            url: YouTube URL to download
-            
         Returns:
-            List[str]: Command arguments for subprocess
+            Tuple[str, ...]: Command arguments without output template and URL
         """
-        output_template = os.path.join(self.output_dir, "%(title)s.%(ext)s")
-        
         cmd = [
             YTDLP_PATH,
             "--ffmpeg-location", ENGINE_DIR,
@@ -156,32 +218,46 @@ class Downloader:
             # 📤 OUTPUT SETTINGS
             # ═══════════════════════════════════════════════════════════════
             "--newline",                # ✅ Progress on new lines (for parsing)
-            "--output", output_template,
-            
-            url
         ]
         
         # Optional: Use aria2c as external downloader for even faster downloads
-        if self.use_aria2c and self._is_aria2c_available():
-            cmd.insert(1, "--external-downloader")
-            cmd.insert(2, "aria2c")
-            cmd.insert(3, "--external-downloader-args")
-            cmd.insert(4, "-x 16 -k 1M")  # 16 connections, 1MB chunks
+        if self._use_aria2c_now:
+            cmd[1:1] = [
+                "--external-downloader", "aria2c",
+                "--external-downloader-args", "-x 16 -k 1M",  # 16 connections, 1MB chunks
+            ]
+        
+        return tuple(cmd)
+    
+    def _build_command(self, url: str) -> List[str]:
+        """
+        Build the yt-dlp command with optimized arguments.
+        
+        Args:
+            url: YouTube URL to download
+            
+        Returns:
+            List[str]: Command arguments for subprocess
+        """
+        if self._use_aria2c_now:
             self._log("🚀 Using aria2c for accelerated download", "INFO")
         
-        return cmd
+        return [*self._base_cmd, "--output", self._output_template, url]
+    
+    @property
+    def output_dir(self) -> str:
+        """Directory to save downloaded MP3 files."""
+        return self._output_dir
+    
+    @output_dir.setter
+    def output_dir(self, value: str) -> None:
+        self._output_dir = value
+        # yt-dlp accepts forward slashes on Windows too
+        self._output_template = os.path.join(value, "%(title)s.%(ext)s").replace('\\', '/')
     
     def _is_aria2c_available(self) -> bool:
-        """Check if aria2c is installed and available."""
-        try:
-            result = subprocess.run(
-                ["aria2c", "--version"],
-                capture_output=True,
-                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        """Check if aria2c is installed and available (cached per process)."""
+        return _aria2c_available()
     
     def download(self, url: str) -> DownloadResult:
         """
@@ -196,7 +272,10 @@ class Downloader:
         Returns:
             DownloadResult: Result object with success status and message
         """
-        self._cancelled = False
+        # _cancelled is only cleared in __init__ (one Downloader per job):
+        # a cancel() that lands before this run starts must not be lost
+        self._last_pct = -1.0
+        self._last_pct_ts = 0.0
         
         # Validate
         if not url:
@@ -217,62 +296,101 @@ class Downloader:
             
             cmd = self._build_command(url)
             
-            # Start subprocess
+            # Start subprocess (binary pipe, read in bulk via os.read)
+            pipe_kwargs = {"pipesize": 1 << 20} if sys.version_info >= (3, 10) else {}
             self._process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                encoding='utf-8',
-                errors='ignore',
-                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+                stderr=subprocess.PIPE,  # ✅ Kept out of the progress parse loop
+                bufsize=0,
+                **pipe_kwargs,
+                **POPEN_KWARGS
+            )
+            
+            # cancel() before _process was set could only raise the flag
+            if self._cancelled:
+                self._process.terminate()
+                return DownloadResult(False, "Download cancelled")
+            
+            # Drain stderr on a side thread; only surfaced if yt-dlp fails
+            stderr_buf = bytearray()
+            stderr_thread = threading.Thread(
+                target=self._drain_stderr,
+                args=(self._process.stderr, stderr_buf),
+                daemon=True
             )
+            stderr_thread.start()
             
             output_file = None
             
-            # Process output line by line
-            for line in self._process.stdout:
+            # Process output line by line (raw bytes, progress lines first)
+            for raw in self._iter_output_lines(self._process.stdout.fileno()):
                 if self._cancelled:
                     self._process.terminate()
                     return DownloadResult(False, "Download cancelled")
                 
-                line = line.strip()
-                if not line:
+                # Parse progress percentage (most frequent line)
+                match = _RE_PROGRESS.search(raw)
+                if match:
+                    if self.log_callback:
+                        self._log(raw.decode('utf-8', 'ignore'), "INFO")
+                    pct = float(match.group(1))
+                    # Decimate: skip visually identical updates
+                    now = time.monotonic()
+                    if (
+                        pct < 100.0
+                        and abs(pct - self._last_pct) < self.PROGRESS_MIN_DELTA
+                        and now - self._last_pct_ts < self.PROGRESS_MIN_INTERVAL
+                    ):
+                        continue
+                    self._last_pct = pct
+                    self._last_pct_ts = now
+                    label = "กำลังดาวน์โหลด..."
+                    speed = _RE_SPEED.search(raw)
+                    eta = _RE_ETA.search(raw)
+                    if speed and eta:
+                        label = (
+                            f"กำลังดาวน์โหลด... {speed.group(1).decode('ascii', 'ignore')}"
+                            f" • ETA {eta.group(1).decode('ascii', 'ignore')}"
+                        )
+                    self._report_progress(label, pct)
                     continue
                 
+                line = raw.decode('utf-8', 'ignore')
                 self._log(line, "INFO")
                 
-                # Parse progress percentage
-                match = self.PROGRESS_REGEX.search(line)
-                if match:
-                    pct = float(match.group(1))
-                    self._report_progress("กำลังดาวน์โหลด...", pct)
+                # Capture output filename (the ExtractAudio one is the final .mp3)
+                dest = _RE_DEST.match(line)
+                if dest:
+                    output_file = dest.group(2).strip()
                 
                 # Detect conversion phase
-                elif "[ExtractAudio]" in line:
+                if "[ExtractAudio]" in line:
                     self._report_progress("แปลงเป็น MP3...", None)
                 
                 # Detect completion
                 elif "Deleting original" in line:
                     self._report_progress("เกือบเสร็จ...", 99.5)
-                
-                # Capture output filename
-                elif "[download] Destination:" in line:
-                    output_file = line.split("Destination:")[-1].strip()
             
             # Wait for process to complete
             return_code = self._process.wait()
             self._process = None
+            stderr_thread.join(timeout=2)
             
             if return_code == 0:
                 self._report_progress("✅ สำเร็จ!", 100.0)
                 self._log("🎉 Download completed successfully!", "SUCCESS")
                 return DownloadResult(True, "Download completed", output_file)
             else:
+                message = f"Failed with code {return_code}"
+                errors = stderr_buf.decode('utf-8', 'ignore').splitlines()
+                for err in errors:
+                    if err.strip():
+                        self._log(err.strip(), "ERROR")
+                        message = err.strip()
                 self._report_progress("❌ ล้มเหลว", 0)
                 self._log(f"❌ Download failed with code: {return_code}", "ERROR")
-                return DownloadResult(False, f"Failed with code {return_code}", error_code=return_code)
+                return DownloadResult(False, message, error_code=return_code)
                 
         except Exception as e:
             self._log(f"❌ Exception: {str(e)}", "ERROR")
@@ -281,6 +399,57 @@ class Downloader:
         finally:
             self._process = None
     
+    @staticmethod
+    def _iter_output_lines(fd: int) -> Iterator[bytes]:
+        """
+        Read a pipe in 64 KiB chunks and yield complete, non-empty lines.
+        
+        Splits on both LF and CR (yt-dlp may redraw progress with CR).
+        Lines are yielded as raw bytes; callers decode only when needed.
+        
+        Args:
+            fd: File descriptor of the subprocess stdout pipe
+            
+        Yields:
+            bytes: Stripped output lines
+        """
+        buf = bytearray()
+        while True:
+            data = os.read(fd, 65536)
+            if not data:
+                break
+            buf += data
+            last = max(buf.rfind(b'\n'), buf.rfind(b'\r'))
+            if last < 0:
+                continue
+            complete = bytes(buf[:last])
+            del buf[:last + 1]
+            for line in complete.splitlines():
+                line = line.strip()
+                if line:
+                    yield line
+        
+        # Trailing output without a final newline
+        line = bytes(buf).strip()
+        if line:
+            yield line
+    
+    @staticmethod
+    def _drain_stderr(stream, buf: bytearray, limit: int = 8192) -> None:
+        """
+        Read a stderr pipe to EOF, keeping only the last `limit` bytes.
+        
+        Prevents the child from blocking on a full stderr pipe while the
+        main loop only reads stdout.
+        """
+        try:
+            for chunk in iter(lambda: stream.read(4096), b''):
+                buf += chunk
+                if len(buf) > limit:
+                    del buf[:-limit]
+        except (OSError, ValueError):
+            pass
+    
     def cancel(self) -> None:
         """Cancel the current download."""
         self._cancelled = True
@@ -301,27 +470,76 @@ class Downloader:
 # 🧵 THREAD-SAFE DECORATOR
 # ══════════════════════════════════════════════════════════════════════════════
 
-import threading
-from functools import wraps
+
+class _BackgroundWorker:
+    """
+    Single persistent daemon thread that runs submitted jobs in order.
+    
+    Avoids creating a new OS thread per download/update click. A daemon
+    thread is used (not ThreadPoolExecutor) so closing the window never
+    blocks on a job that is still running.
+    """
+    
+    def __init__(self, name: str = "infinity-worker"):
+        self._name = name
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a job for the worker thread (started lazily).
+        
+        Returns:
+            Future: Completes with the job's result; cancel() drops it
+            if it has not started yet
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+        self._queue.put((future, func, args, kwargs))
+        return future
+    
+    def _run(self) -> None:
+        while True:
+            future, func, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+                # Callers rarely keep the Future: report it like an
+                # uncaught exception in a plain thread would have been
+                # (never let the report itself kill the worker)
+                if not isinstance(e, SystemExit) and sys.stderr is not None:
+                    try:
+                        print(f"⚠️ Background job {getattr(func, '__qualname__', func)} failed:",
+                              file=sys.stderr)
+                        traceback.print_exception(type(e), e, e.__traceback__)
+                    except Exception:
+                        pass
+
+
+_WORKER = _BackgroundWorker()
 
 
 def run_in_thread(func: Callable) -> Callable:
     """
-    Decorator to run a function in a separate daemon thread.
+    Decorator to run a function on the shared background worker thread.
+    
+    Calls are queued and executed one at a time in submission order.
     
     Usage:
         @run_in_thread
         def my_long_running_task():
             ...
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        thread = threading.Thread(
-            target=func,
-            args=args,
-            kwargs=kwargs,
-            daemon=True
-        )
-        thread.start()
-        return thread
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Future:
+        return _WORKER.submit(func, *args, **kwargs)
     return wrapper
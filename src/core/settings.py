@@ -4,16 +4,47 @@
 ║              Persistent Configuration with JSON Storage                       ║
 ╠══════════════════════════════════════════════════════════════════════════════╣
 ║  💾 Cache-based settings to reduce I/O                                       ║
+║  🔍 mtime + size fingerprint (re-parse only when file changed on disk)       ║
+║  🔒 Atomic writes via os.replace (single write + fsync)                      ║
+║  🕒 Debounced writes (a burst of updates costs one write)                    ║
 ║  📁 JSON file persistence                                                     ║
 ║  🔄 Automatic first-run detection                                            ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import atexit
 import json
 import os
-from typing import Dict, Any, Optional
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 from src.utils.paths import SETTINGS_FILE
+from src.utils.debug import debug_print
+
+# Optional fast JSON backend (Rust-based); stdlib json is the fallback.
+# Both produce/consume UTF-8 bytes so the file is read/written in binary.
+try:
+    import orjson
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+# Sibling temp file for atomic replace (same directory => same volume)
+_SETTINGS_TMP = SETTINGS_FILE + ".tmp"
+
+# fdatasync flushes the data without forcing a metadata journal write
+# (POSIX); Windows only has fsync (FlushFileBuffers).
+_datasync = getattr(os, "fdatasync", os.fsync)
 
 
 class SettingsManager:
@@ -22,43 +53,154 @@ class SettingsManager:
     
     Manages application settings using JSON file storage.
     Uses class-level caching to minimize disk I/O.
+    
+    The cache is tagged with the (st_mtime_ns, st_size) fingerprint of
+    the file it was read from, so it is only re-parsed when the file
+    actually changed on disk.
     """
     
     _cache: Optional[Dict[str, Any]] = None
+    _cache_view: Optional[Mapping[str, Any]] = None
+    _cache_mtime: Optional[int] = None
+    _cache_size: Optional[int] = None
+    
+    # Resolved values of the hot keys, refreshed with the cache
+    _download_path: str = ""
+    _first_run_complete: bool = False
+    
+    # save() is reachable from worker threads (run_in_thread)
+    _lock = threading.Lock()
+    
+    # Debounced writes: update() stages into the cache and a timer
+    # flushes the whole burst to disk once
+    SAVE_DEBOUNCE_S: float = 0.1
+    _dirty: bool = False
+    _flush_timer: Optional[threading.Timer] = None
     
     DEFAULT_SETTINGS: Dict[str, Any] = {
         "download_path": "",
         "first_run_complete": False,
+        "font_family": "",
     }
     
+    @staticmethod
+    def _fingerprint() -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the on-disk fingerprint of the settings file.
+        
+        Returns:
+            Tuple[Optional[int], Optional[int]]: (st_mtime_ns, st_size),
+            or (None, None) if the file does not exist
+        """
+        try:
+            st = os.stat(SETTINGS_FILE)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return (None, None)
+    
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> None:
+        """
+        Write the whole payload with raw os.write calls and sync it.
+        
+        The payload is serialized up front, so this is normally a single
+        write syscall (the loop only handles short writes).
+        
+        Args:
+            path: Destination file path
+            data: Serialized settings
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            _datasync(fd)
+        finally:
+            os.close(fd)
+    
+    @classmethod
+    def _set_cache(
+        cls,
+        settings: Dict[str, Any],
+        fingerprint: Tuple[Optional[int], Optional[int]]
+    ) -> None:
+        """
+        Replace the cache and refresh the resolved hot-key attributes.
+        
+        Args:
+            settings: Settings dictionary (already merged with defaults)
+            fingerprint: (st_mtime_ns, st_size) of the file it matches
+        """
+        cls._cache = settings
+        cls._cache_view = MappingProxyType(settings)
+        cls._cache_mtime, cls._cache_size = fingerprint
+        cls._download_path = settings.get("download_path") or ""
+        cls._first_run_complete = bool(settings.get("first_run_complete", False))
+    
+    @classmethod
+    def load(cls) -> Mapping[str, Any]:
+        """
+        Load settings from file (uses cache if file is unchanged).
+        
+        The result is a read-only view of the cache; use update() or
+        save() to change settings.
+        
+        Returns:
+            Mapping[str, Any]: Settings merged with defaults (read-only)
+        """
+        with cls._lock:
+            return cls._load_locked()
+    
     @classmethod
-    def load(cls) -> Dict[str, Any]:
+    def _load_locked(cls) -> Mapping[str, Any]:
         """
-        Load settings from file (uses cache if available).
+        Body of load() (caller holds _lock).
         
         Returns:
-            Dict[str, Any]: Settings dictionary merged with defaults
+            Mapping[str, Any]: Settings merged with defaults (read-only)
         """
-        if cls._cache is not None:
-            return cls._cache
+        if cls._dirty:
+            # Staged changes not yet on disk win over the file
+            return cls._cache_view
+        
+        mtime, size = cls._fingerprint()
+        if (
+            cls._cache is not None
+            and mtime == cls._cache_mtime
+            and size == cls._cache_size
+        ):
+            return cls._cache_view
         
         try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-                    cls._cache = {**cls.DEFAULT_SETTINGS, **settings}
-                    print(f"✓ Loaded settings from: {SETTINGS_FILE}")
-                    return cls._cache
+            if mtime is not None:
+                with open(SETTINGS_FILE, 'rb') as f:
+                    # Fingerprint the handle we read, not the earlier stat
+                    st = os.fstat(f.fileno())
+                    settings = _loads(f.read())
+                merged = cls.DEFAULT_SETTINGS.copy()
+                merged.update(settings)
+                cls._set_cache(merged, (st.st_mtime_ns, st.st_size))
+                debug_print("✓ Loaded settings from:", SETTINGS_FILE)
+                return cls._cache_view
+        except FileNotFoundError:
+            # Removed between stat and open: same as no file
+            mtime = size = None
         except Exception as e:
             print(f"⚠️ Failed to load settings: {e}")
         
-        cls._cache = cls.DEFAULT_SETTINGS.copy()
-        return cls._cache
+        cls._set_cache(cls.DEFAULT_SETTINGS.copy(), (mtime, size))
+        return cls._cache_view
     
     @classmethod
-    def save(cls, settings: Dict[str, Any]) -> bool:
+    def save(cls, settings: Mapping[str, Any]) -> bool:
         """
-        Save settings to file and update cache.
+        Save settings to file now and update cache (synchronous).
+        
+        Supersedes any staged update() that has not been flushed yet.
+        Skips all I/O when the settings are equal to what is already
+        on disk.
         
         Args:
             settings: Settings dictionary to save
@@ -66,27 +208,114 @@ class SettingsManager:
         Returns:
             bool: True if save was successful
         """
+        with cls._lock:
+            cls._cancel_flush()
+            if (
+                not cls._dirty
+                and settings == cls._cache
+                and cls._fingerprint() == (cls._cache_mtime, cls._cache_size)
+            ):
+                return True
+            return cls._write_locked(settings)
+    
+    @classmethod
+    def _write_locked(cls, settings: Mapping[str, Any]) -> bool:
+        """
+        Atomically write settings to disk (caller holds _lock).
+        
+        Args:
+            settings: Settings dictionary to write
+            
+        Returns:
+            bool: True if write was successful
+        """
         try:
-            with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
-            cls._cache = settings
-            print(f"✓ Saved settings to: {SETTINGS_FILE}")
+            cls._write_file(_SETTINGS_TMP, _dumps(settings))
+            os.replace(_SETTINGS_TMP, SETTINGS_FILE)
+            # Own a private copy so the caller cannot mutate the cache
+            cls._set_cache(dict(settings), cls._fingerprint())
+            cls._dirty = False
+            debug_print("✓ Saved settings to:", SETTINGS_FILE)
             return True
         except Exception as e:
             print(f"❌ Failed to save settings: {e}")
+            try:
+                os.remove(_SETTINGS_TMP)
+            except OSError:
+                pass
             return False
     
+    @classmethod
+    def _cancel_flush(cls) -> None:
+        """Cancel the pending flush timer, if any (caller holds _lock)."""
+        if cls._flush_timer is not None:
+            cls._flush_timer.cancel()
+            cls._flush_timer = None
+    
+    @classmethod
+    def _stage_locked(cls, settings: Dict[str, Any]) -> None:
+        """
+        Put settings into the cache and schedule a debounced flush
+        (caller holds _lock).
+        
+        Args:
+            settings: New settings dictionary (owned by the cache)
+        """
+        cls._set_cache(settings, (cls._cache_mtime, cls._cache_size))
+        cls._dirty = True
+        if cls._flush_timer is None:
+            cls._flush_timer = threading.Timer(cls.SAVE_DEBOUNCE_S, cls.flush)
+            cls._flush_timer.daemon = True
+            cls._flush_timer.start()
+    
+    @classmethod
+    def flush(cls) -> bool:
+        """
+        Write staged changes to disk now (also runs at exit).
+        
+        Returns:
+            bool: True if nothing was pending or the write succeeded
+        """
+        with cls._lock:
+            cls._cancel_flush()
+            if not cls._dirty:
+                return True
+            return cls._write_locked(cls._cache)
+    
+    @classmethod
+    def update(cls, **changes: Any) -> bool:
+        """
+        Apply changed keys and save only if something actually differs.
+        
+        The change is visible to load() immediately; the disk write is
+        debounced by SAVE_DEBOUNCE_S so a burst of updates costs one write.
+        Read, diff and stage happen under one lock, so concurrent updates
+        never drop each other's keys.
+        
+        Args:
+            **changes: Setting keys and their new values
+            
+        Returns:
+            bool: True once the change is staged (or nothing differed).
+            This does not mean it is on disk yet: call flush() for the
+            result of the write.
+        """
+        with cls._lock:
+            current = cls._load_locked()
+            diff = {k: v for k, v in changes.items() if current.get(k) != v}
+            if diff:
+                cls._stage_locked({**current, **diff})
+        return True
+    
     @classmethod
     def clear_path(cls) -> bool:
         """
         Clear download_path from settings (session-only mode).
         
         Returns:
-            bool: True if operation was successful
+            bool: True once staged (see update(); flush() reports the write)
         """
-        settings = cls.load()
-        settings["download_path"] = ""
-        return cls.save(settings)
+        return cls.update(download_path="")
     
     @classmethod
     def save_path(cls, path: str) -> bool:
@@ -97,12 +326,9 @@ class SettingsManager:
             path: Download directory path to save
             
         Returns:
-            bool: True if operation was successful
+            bool: True once staged (see update(); flush() reports the write)
         """
-        settings = cls.load()
-        settings["download_path"] = path
-        settings["first_run_complete"] = True
-        return cls.save(settings)
+        return cls.update(download_path=path, first_run_complete=True)
     
     @classmethod
     def get_path(cls) -> str:
@@ -112,8 +338,8 @@ class SettingsManager:
         Returns:
             str: Download path or empty string if not set
         """
-        settings = cls.load()
-        return settings.get("download_path", "")
+        cls.load()
+        return cls._download_path
     
     @classmethod
     def has_saved_path(cls) -> bool:
@@ -123,8 +349,8 @@ class SettingsManager:
         Returns:
             bool: True if a non-empty path exists
         """
-        settings = cls.load()
-        return bool(settings.get("download_path", ""))
+        cls.load()
+        return bool(cls._download_path)
     
     @classmethod
     def is_first_run(cls) -> bool:
@@ -134,10 +360,26 @@ class SettingsManager:
         Returns:
             bool: True if first_run_complete is False
         """
-        settings = cls.load()
-        return not settings.get("first_run_complete", False)
+        cls.load()
+        return not cls._first_run_complete
     
     @classmethod
     def invalidate_cache(cls) -> None:
         """Force reload settings from disk on next access."""
-        cls._cache = None
+        cls.flush()
+        with cls._lock:
+            cls._cache = None
+            cls._cache_view = None
+            cls._cache_mtime = None
+            cls._cache_size = None
+            cls._download_path = ""
+            cls._first_run_complete = False
+
+
+# Never lose a staged update on normal interpreter exit (incl. sys.exit)
+atexit.register(SettingsManager.flush)
+
+# Warm the cache off the main thread; an early caller just waits on _lock
+threading.Thread(
+    target=SettingsManager.load, name="settings-preload", daemon=True
+).start()
@@ -14,17 +14,25 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import atexit
+import json
 import os
+import re
 import sys
 import subprocess
-import requests
-import tempfile
-import zipfile
-import shutil
-from typing import Callable, Optional, Dict, Any, Tuple
+import threading
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-from src.utils.paths import ENGINE_DIR, YTDLP_PATH, is_frozen
+from src.utils.paths import APP_VERSION, ENGINE_DIR, YTDLP_PATH, ensure_engine_dir, is_frozen
+from src.utils.process import POPEN_KWARGS
+from src.utils.debug import DEBUG, debug_print
+
+# requests (urllib3/ssl/certifi), zipfile, shutil and tempfile are imported
+# inside the functions that use them, keeping this module cheap to import
+if TYPE_CHECKING:
+    import requests
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -51,6 +59,8 @@ class VersionInfo:
     version: str
     download_url: str
     release_notes: str = ""
+    size: int = 0          # Asset size in bytes (0 = unknown)
+    sha256: str = ""       # Lower-case hex digest ("" = unknown)
     
     def __bool__(self) -> bool:
         return bool(self.version and self.download_url)
@@ -73,14 +83,367 @@ ProgressCallback = Callable[[str, float], None]  # (label, percentage)
 LogCallback = Callable[[str, str], None]  # (message, level)
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# SHARED HTTP SESSION
+# ══════════════════════════════════════════════════════════════════════════════
+
+_SESSION: Optional["requests.Session"] = None
+
+
+# Streaming read size: fewer Python-level iterations per MB than 8 KB
+DOWNLOAD_CHUNK_SIZE = 128 * 1024
+
+# Download progress is reported at most every 250 ms or every 1 MB
+PROGRESS_MIN_INTERVAL = 0.25
+PROGRESS_MIN_BYTES = 1024 * 1024
+
+# App update packages up to this size are buffered in RAM, not on disk
+SPOOL_MAX_SIZE = 32 * 1024 * 1024
+
+# Packages from this size up are fetched as PARALLEL_PARTS byte ranges
+# over separate connections (the CDN caps single-flow throughput)
+PARALLEL_MIN_SIZE = 20 * 1024 * 1024
+PARALLEL_PARTS = 4
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# BACKGROUND TASKS
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Set once the interpreter starts shutting down (window closed): running
+# transfers stop at their next chunk and no update script is launched
+_SHUTTING_DOWN = threading.Event()
+atexit.register(_SHUTTING_DOWN.set)
+
+
+class _DaemonTask:
+    """
+    Run a function on a daemon thread; result() joins and re-raises.
+    
+    Used instead of ThreadPoolExecutor, whose workers are joined at
+    interpreter exit: closing the window mid-update must end the process
+    rather than keep downloading with no window showing.
+    """
+    
+    def __init__(self, func: Callable, *args: Any):
+        self._result: Any = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, args=(func, args), daemon=True)
+        self._thread.start()
+    
+    def _run(self, func: Callable, args: tuple) -> None:
+        try:
+            self._result = func(*args)
+        except BaseException as e:
+            self._error = e
+    
+    def result(self) -> Any:
+        """Wait for the task and return its result (or raise its error)."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the process-wide HTTP session used by all update requests.
+    
+    Keep-alive connections are reused across update checks, so repeat
+    clicks skip the TCP + TLS handshake to GitHub, and transient 5xx /
+    connection errors are retried by urllib3.
+    
+    Returns:
+        requests.Session: Shared session with a small connection pool
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        # Transient CDN errors and connection resets are retried with
+        # backoff (0.5s, 1s, 2s) before the caller ever sees them;
+        # raise_on_status=False hands the last 5xx to raise_for_status()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(
+            pool_connections=2, pool_maxsize=4, max_retries=retry
+        ))
+        # GitHub asks API clients to identify themselves; compressed bodies
+        # roughly halve the release JSON on the wire
+        session.headers.update({
+            "User-Agent": f"InfinityMP3Downloader/{APP_VERSION}",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        _SESSION = session
+    return _SESSION
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# STREAMING DOWNLOAD HELPER
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _download_to_file(
+    url: str,
+    dest: BinaryIO,
+    *,
+    progress_callback: Optional[ProgressCallback] = None,
+    base: float = 0.0,
+    span: float = 100.0,
+    unit: Tuple[int, str] = (1024, "KB"),
+    timeout: int = 60,
+    preallocate: bool = False,
+    resume_from: int = 0,
+    hasher: Optional[Any] = None,
+    parallel_min_size: int = 0
+) -> int:
+    """
+    Stream a URL into an open binary file object.
+    
+    Progress is mapped onto [base, base + span] and reported at most
+    every PROGRESS_MIN_BYTES / PROGRESS_MIN_INTERVAL (and on the last chunk).
+    
+    Args:
+        url: URL to download
+        dest: Writable, seekable binary file object
+        progress_callback: Progress update function
+        base: Percentage reported at 0 bytes
+        span: Percentage range covered by the download
+        unit: (divisor, suffix) for the size shown in the label
+        timeout: Connect/read timeout in seconds
+        preallocate: Extend a real file to content-length up front so the
+            filesystem allocates it once instead of on every write
+        resume_from: Bytes of ``dest`` already holding the start of the
+            file; they are kept if the server answers the Range with 206
+        hasher: hashlib object fed every byte of the final file while it
+            streams (a resumed prefix is read back and hashed first)
+        parallel_min_size: If non-zero, a range-capable body at least this
+            large is fetched by _download_parallel, with this response
+            serving the first slice (no extra HEAD request)
+    
+    Returns:
+        int: Size of the file in ``dest`` (resumed bytes included)
+    """
+    divisor, suffix = unit
+    last_report_ts = 0.0
+    session = get_session()
+    
+    response = session.get(
+        url, stream=True, timeout=timeout,
+        headers={"Range": f"bytes={resume_from}-"} if resume_from > 0 else None
+    )
+    if resume_from > 0 and response.status_code == 416:
+        # The partial is not a prefix of the current file: start over
+        response.close()
+        response = session.get(url, stream=True, timeout=timeout)
+    
+    with response:
+        response.raise_for_status()
+        # 206 = the server honoured the Range; 200 = full body from byte 0
+        start = resume_from if response.status_code == 206 else 0
+        total_size = int(response.headers.get('content-length', 0))
+        if total_size > 0:
+            total_size += start
+        
+        if (
+            parallel_min_size
+            and start == 0
+            and total_size >= parallel_min_size
+            and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            and not response.headers.get("Content-Encoding")
+        ):
+            return _download_parallel(
+                url, dest, total_size,
+                first_response=response,
+                progress_callback=progress_callback,
+                base=base,
+                span=span,
+                unit=unit,
+                timeout=timeout,
+                hasher=hasher
+            )
+        
+        if hasher is not None and start:
+            dest.seek(0)
+            remaining = start
+            while remaining:
+                block = dest.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+                if not block:
+                    break
+                hasher.update(block)
+                remaining -= len(block)
+        
+        dest.seek(start)
+        dest.truncate()
+        if preallocate and total_size > 0:
+            dest.truncate(total_size)
+            dest.seek(start)
+        
+        downloaded = last_report_bytes = start
+        try:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                dest.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                downloaded += len(chunk)
+                if progress_callback and total_size > 0:
+                    now = time.monotonic()
+                    if (
+                        downloaded - last_report_bytes >= PROGRESS_MIN_BYTES
+                        or now - last_report_ts >= PROGRESS_MIN_INTERVAL
+                        or downloaded >= total_size
+                    ):
+                        last_report_ts, last_report_bytes = now, downloaded
+                        pct = base + (downloaded / total_size) * span
+                        progress_callback(f"ดาวน์โหลด... {downloaded // divisor} {suffix}", pct)
+        finally:
+            if preallocate and total_size > 0 and downloaded != total_size:
+                # content-length is the encoded size (gzip) or the body was
+                # cut short: trim to what was written, so an interrupted
+                # file stays a valid prefix to resume from
+                dest.truncate(downloaded)
+    
+    return downloaded
+
+
+def _download_parallel(
+    url: str,
+    dest: BinaryIO,
+    total_size: int,
+    *,
+    progress_callback: Optional[ProgressCallback] = None,
+    base: float = 0.0,
+    span: float = 100.0,
+    unit: Tuple[int, str] = (1024, "KB"),
+    timeout: int = 60,
+    parts: int = PARALLEL_PARTS,
+    hasher: Optional[Any] = None,
+    first_response: Optional["requests.Response"] = None
+) -> int:
+    """
+    Download a URL as concurrent byte ranges into one file object.
+    
+    Each worker writes its slice at its own offset; writes share one
+    lock, so ``dest`` may be any seekable file (a spool included). The
+    first failing range stops the others.
+    
+    Args:
+        url: URL to download (must answer Range requests with 206)
+        dest: Writable, seekable binary file object
+        total_size: Full size of the body in bytes
+        progress_callback: Progress update function
+        base: Percentage reported at 0 bytes
+        span: Percentage range covered by the download
+        unit: (divisor, suffix) for the size shown in the label
+        timeout: Connect/read timeout in seconds
+        parts: Number of ranges / connections
+        hasher: hashlib object fed the finished file (read back in order)
+        first_response: Open full-body response; it supplies the first
+            slice and is closed once that slice is written
+    
+    Returns:
+        int: Number of bytes written
+    
+    Raises:
+        UpdateError: If the server ignores a Range or a slice comes up short
+    """
+    divisor, suffix = unit
+    session = get_session()
+    lock = threading.Lock()
+    failed = threading.Event()
+    state = {"done": 0, "ts": 0.0, "bytes": 0}
+    
+    dest.seek(0)
+    dest.truncate(total_size)
+    
+    def fetch(start: int, end: int, response: Optional["requests.Response"] = None) -> None:
+        if response is None:
+            response = session.get(
+                url, stream=True, timeout=timeout,
+                headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+            )
+            if response.status_code != 206:
+                response.close()
+                response.raise_for_status()
+                raise UpdateError("Server ignored the Range request")
+        pos = start
+        with response:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                if failed.is_set() or _SHUTTING_DOWN.is_set():
+                    return
+                # A full-body response runs past its slice: cut it there
+                chunk = chunk[:end + 1 - pos]
+                with lock:
+                    dest.seek(pos)
+                    dest.write(chunk)
+                    pos += len(chunk)
+                    state["done"] += len(chunk)
+                    done = state["done"]
+                    now = time.monotonic()
+                    if progress_callback and (
+                        done - state["bytes"] >= PROGRESS_MIN_BYTES
+                        or now - state["ts"] >= PROGRESS_MIN_INTERVAL
+                        or done >= total_size
+                    ):
+                        state["ts"], state["bytes"] = now, done
+                        pct = base + (done / total_size) * span
+                        progress_callback(f"ดาวน์โหลด... {done // divisor} {suffix}", pct)
+                if pos > end:
+                    break
+        if pos != end + 1:
+            raise UpdateError(f"Range {start}-{end} ended at byte {pos}")
+    
+    def run(start: int, end: int, response: Optional["requests.Response"] = None) -> None:
+        try:
+            fetch(start, end, response)
+        except BaseException:
+            failed.set()
+            raise
+    
+    step = -(-total_size // parts)
+    ranges = [(start, min(start + step, total_size) - 1) for start in range(0, total_size, step)]
+    debug_print("[DEBUG] Parallel download:", len(ranges), "ranges of", step, "bytes")
+    tasks = [
+        _DaemonTask(run, start, end, first_response if i == 0 else None)
+        for i, (start, end) in enumerate(ranges)
+    ]
+    for task in tasks:
+        task.result()
+    if _SHUTTING_DOWN.is_set():
+        raise UpdateError("Application is closing")
+    
+    if hasher is not None:
+        dest.seek(0)
+        while True:
+            block = dest.read(DOWNLOAD_CHUNK_SIZE * 8)
+            if not block:
+                break
+            hasher.update(block)
+    
+    return state["done"]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # VERSION COMPARISON UTILITIES
 # ══════════════════════════════════════════════════════════════════════════════
 
+_RE_VERSION_PART = re.compile(r'\d+')
+
+
 def compare_versions(local: str, remote: str) -> int:
     """
     Compare version strings.
     
+    Every run of digits is one component ("v2023.11.16" -> 2023, 11, 16),
+    so prefixes and separators (v, ., -, _) need no special handling.
+    
     Args:
         local: Local version string
         remote: Remote version string
@@ -90,145 +453,347 @@ def compare_versions(local: str, remote: str) -> int:
          0: local == remote (up to date)
          1: local > remote (local is newer)
     """
-    def normalize(v: str) -> list:
-        """Convert version string to list of integers for comparison."""
-        v = v.strip().lstrip('v').lstrip('V')
-        parts = []
-        for part in v.replace('-', '.').replace('_', '.').split('.'):
-            try:
-                parts.append(int(part))
-            except ValueError:
-                parts.append(0)
-        return parts
+    a = tuple(map(int, _RE_VERSION_PART.findall(local or "")))
+    b = tuple(map(int, _RE_VERSION_PART.findall(remote or "")))
+    
+    # Pad to equal length so "1.2" == "1.2.0"
+    n = max(len(a), len(b))
+    a += (0,) * (n - len(a))
+    b += (0,) * (n - len(b))
+    
+    return (a > b) - (a < b)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FILE INTEGRITY
+# ══════════════════════════════════════════════════════════════════════════════
+
+def file_sha256(path: str) -> Optional[str]:
+    """
+    Hash a file with SHA-256.
+    
+    Args:
+        path: File to hash
+    
+    Returns:
+        str: Lower-case hex digest, or None if the file cannot be read
+    """
+    import hashlib
     
     try:
-        local_parts = normalize(local)
-        remote_parts = normalize(remote)
-        
-        # Pad to equal length
-        max_len = max(len(local_parts), len(remote_parts))
-        local_parts.extend([0] * (max_len - len(local_parts)))
-        remote_parts.extend([0] * (max_len - len(remote_parts)))
-        
-        for l, r in zip(local_parts, remote_parts):
-            if l < r:
-                return -1
-            elif l > r:
-                return 1
-        return 0
-        
-    except Exception:
-        if local == remote:
-            return 0
-        return -1 if local < remote else 1
+        with open(path, 'rb') as f:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            h = hashlib.sha256()
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(block)
+            return h.hexdigest()
+    except OSError:
+        return None
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 # YT-DLP VERSION CHECKING
 # ══════════════════════════════════════════════════════════════════════════════
 
+# (path, st_mtime_ns, st_size) -> parsed `--version` output
+_VERSION_CACHE: Dict[Tuple[str, int, int], Optional[str]] = {}
+
+
 def get_local_ytdlp_version(ytdlp_path: str) -> Optional[str]:
     """
     Get the version of the local yt-dlp binary.
     
+    The result is memoized per (path, mtime, size), so the binary is only
+    spawned again after it was replaced on disk.
+    
     Args:
         ytdlp_path: Path to yt-dlp.exe
     
     Returns:
         str: Version string (e.g., "2023.11.16") or None if not found
     """
-    if not os.path.exists(ytdlp_path):
-        print(f"[DEBUG] yt-dlp not found at: {ytdlp_path}")
+    try:
+        st = os.stat(ytdlp_path)
+    except OSError:
+        debug_print("[DEBUG] yt-dlp not found at:", ytdlp_path)
         return None
     
+    key = (ytdlp_path, st.st_mtime_ns, st.st_size)
+    if key in _VERSION_CACHE:
+        return _VERSION_CACHE[key]
+    
     try:
         result = subprocess.run(
             [ytdlp_path, "--version"],
             capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='ignore',
+            stdin=subprocess.DEVNULL,
             timeout=15,
-            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            **POPEN_KWARGS
         )
         
-        print(f"[DEBUG] yt-dlp --version stdout: '{result.stdout.strip()}'")
+        # Version output is plain ASCII ("2023.11.16"): decode the bytes once
+        stdout = result.stdout.decode('ascii', 'ignore').strip()
+        # Arguments, not an f-string: nothing is formatted unless DEBUG is on
+        debug_print("[DEBUG] yt-dlp --version stdout:", stdout)
         
         if result.returncode == 0:
-            version = result.stdout.strip()
-            return version if version else None
+            version = stdout or None
         else:
-            print(f"[DEBUG] yt-dlp --version failed: return code {result.returncode}")
-            return None
+            debug_print("[DEBUG] yt-dlp --version failed: return code", result.returncode)
+            version = None
+        
+        # Only a completed run is cached; timeouts/errors are retried
+        _VERSION_CACHE[key] = version
+        return version
         
     except subprocess.TimeoutExpired:
-        print(f"[DEBUG] yt-dlp --version timed out")
+        debug_print("[DEBUG] yt-dlp --version timed out")
         return None
     except FileNotFoundError:
-        print(f"[DEBUG] yt-dlp executable not found")
+        debug_print("[DEBUG] yt-dlp executable not found")
         return None
     except Exception as e:
-        print(f"[DEBUG] Error getting yt-dlp version: {type(e).__name__}: {e}")
+        if DEBUG:
+            debug_print("[DEBUG] Error getting yt-dlp version:", type(e).__name__, e)
         return None
 
 
-def get_remote_ytdlp_version() -> Optional[VersionInfo]:
+YTDLP_RELEASE_API = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
+
+# Media type + pinned REST API version recommended by GitHub
+GITHUB_API_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+
+# Passive checks reuse an answer younger than this without any network I/O
+REMOTE_CHECK_TTL = 6 * 60 * 60
+
+# Conditional-GET state, persisted so validators survive restarts:
+# url -> {"etag": str, "last_modified": str, "ts": float, "data": {...},
+#         "backoff_until": float (only while rate limited)}
+_CHECK_CACHE_FILE = os.path.join(ENGINE_DIR, ".update_check_cache.json")
+_CHECK_CACHE: Dict[str, Dict[str, Any]] = {}
+_check_cache_loaded = False
+# The app and yt-dlp checks run concurrently: every read-modify-write of
+# _CHECK_CACHE (and the file behind it) happens under this lock
+_CHECK_CACHE_LOCK = threading.Lock()
+
+
+def _load_check_cache() -> None:
     """
-    Get the latest yt-dlp version from GitHub API.
+    Read the persisted check cache once per process (best effort).
     
-    Returns:
-        VersionInfo or None if check failed
+    Caller holds _CHECK_CACHE_LOCK, so a concurrent check never sees
+    the cache before the file has been read.
     """
-    API_URL = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
+    global _check_cache_loaded
+    if _check_cache_loaded:
+        return
+    try:
+        with open(_CHECK_CACHE_FILE, 'rb') as f:
+            data = json.loads(f.read())
+        if isinstance(data, dict):
+            _CHECK_CACHE.update(data)
+    except (OSError, ValueError):
+        pass
+    _check_cache_loaded = True
+
+
+def _save_check_cache() -> None:
+    """
+    Persist the check cache atomically (best effort).
     
+    Caller holds _CHECK_CACHE_LOCK. The snapshot goes through a unique
+    temp file, so an interrupted write never leaves a half-written cache.
+    """
+    import tempfile
+    
+    tmp_path = None
     try:
-        response = requests.get(
-            API_URL,
-            headers={"Accept": "application/vnd.github.v3+json"},
-            timeout=15
+        ensure_engine_dir()
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".update_check_cache.", suffix=".tmp", dir=ENGINE_DIR
         )
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(_CHECK_CACHE, f)
+        os.replace(tmp_path, _CHECK_CACHE_FILE)
+        tmp_path = None
+    except OSError:
+        pass
+    finally:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _get_json_cached(
+    url: str,
+    extract: Callable[[Any], Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    max_age: float = 0.0
+) -> Optional[Dict[str, Any]]:
+    """
+    GET a JSON document with ETag revalidation and an optional TTL.
+    
+    Only the fields returned by ``extract`` are cached. Both validators
+    (ETag and Last-Modified) are sent back; a 304 (nothing changed)
+    returns the cached fields without decoding a body, and GitHub does
+    not count it against the rate limit.
+    
+    Args:
+        url: JSON endpoint
+        extract: Turns the parsed JSON into the small dict to cache
+        headers: Extra request headers
+        max_age: Serve the cached fields without a request if they are
+            younger than this many seconds (0 = always revalidate)
+    
+    Returns:
+        Dict[str, Any] or None if the request failed
+    """
+    # The request itself runs outside the lock, so both checks overlap
+    with _CHECK_CACHE_LOCK:
+        _load_check_cache()
+        entry = _CHECK_CACHE.get(url)
+        now = time.time()
+        if entry and now < entry.get("backoff_until", 0):
+            # Rate limited earlier: spend no request until the window resets
+            return entry.get("data")
+        if entry and max_age > 0 and now - entry.get("ts", 0) < max_age:
+            return entry["data"]
         
-        # Handle rate limit
-        if response.status_code == 403:
-            remaining = response.headers.get('X-RateLimit-Remaining', '0')
-            if remaining == '0':
-                print("⚠️ GitHub API rate limit exceeded")
-                return None
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        version = data.get("tag_name", "").strip()
-        
-        # Find download URL for Windows exe
-        download_url = ""
-        for asset in data.get("assets", []):
-            if asset.get("name") == "yt-dlp.exe":
-                download_url = asset.get("browser_download_url", "")
-                break
+        headers = dict(headers or {})
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    
+    try:
+        response = get_session().get(url, headers=headers, timeout=15)
         
-        # Fallback URL
-        if not download_url:
-            download_url = f"https://github.com/yt-dlp/yt-dlp/releases/download/{version}/yt-dlp.exe"
+        if response.status_code == 304 and entry:
+            with _CHECK_CACHE_LOCK:
+                entry["ts"] = time.time()
+                _save_check_cache()
+            return entry["data"]
         
-        return VersionInfo(
-            version=version,
-            download_url=download_url,
-            release_notes=data.get("body", "")[:500]
-        )
+        # Handle rate limit: remember when the window resets
+        if response.status_code in (403, 429):
+            if response.headers.get('X-RateLimit-Remaining') == '0':
+                print("⚠️ GitHub API rate limit exceeded")
+                with _CHECK_CACHE_LOCK:
+                    entry = _CHECK_CACHE.setdefault(url, {"data": None})
+                    entry["backoff_until"] = _rate_limit_reset(response, now)
+                    _save_check_cache()
+                return entry.get("data")
         
-    except requests.RequestException:
-        return None
+        response.raise_for_status()
+        data = extract(response.json())
     except Exception:
         return None
+    
+    entry = {
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+        "ts": time.time(),
+        "data": data,
+    }
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        # This was the last request of the window: the next one would 403
+        entry["backoff_until"] = _rate_limit_reset(response, now)
+    with _CHECK_CACHE_LOCK:
+        _CHECK_CACHE[url] = entry
+        _save_check_cache()
+    return data
 
 
-def check_ytdlp_update(engine_dir: str) -> Tuple[bool, str, str]:
+def _rate_limit_reset(response: "requests.Response", now: float) -> float:
+    """
+    Get the time at which the GitHub rate-limit window resets.
+    
+    Args:
+        response: Response carrying the X-RateLimit-* headers
+        now: Current time.time()
+    
+    Returns:
+        float: Epoch seconds of the reset (at least a minute from now)
+    """
+    try:
+        reset = float(response.headers.get('X-RateLimit-Reset', 0))
+    except ValueError:
+        reset = 0.0
+    return max(reset, now + 60)
+
+
+def _extract_ytdlp_release(data: Dict[str, Any]) -> Dict[str, str]:
+    """Pick version, exe URL and notes out of a GitHub release JSON."""
+    version = data.get("tag_name", "").strip()
+    
+    # Find download URL (and size/digest) for Windows exe
+    download_url = ""
+    size = 0
+    sha256 = ""
+    for asset in data.get("assets", []):
+        if asset.get("name") == "yt-dlp.exe":
+            download_url = asset.get("browser_download_url", "")
+            size = int(asset.get("size") or 0)
+            digest = asset.get("digest") or ""
+            if digest.startswith("sha256:"):
+                sha256 = digest[7:].lower()
+            break
+    
+    # Fallback URL
+    if not download_url:
+        download_url = f"https://github.com/yt-dlp/yt-dlp/releases/download/{version}/yt-dlp.exe"
+    
+    return {
+        "version": version,
+        "download_url": download_url,
+        "release_notes": (data.get("body") or "")[:500],
+        "size": size,
+        "sha256": sha256,
+    }
+
+
+def get_remote_ytdlp_version(max_age: float = 0.0) -> Optional[VersionInfo]:
+    """
+    Get the latest yt-dlp version from GitHub API.
+    
+    Repeat checks send If-None-Match (also across restarts), so an
+    unchanged release costs a bodiless 304.
+    
+    Args:
+        max_age: Reuse a result younger than this many seconds without
+            contacting GitHub (0 = always revalidate)
+    
+    Returns:
+        VersionInfo or None if check failed
+    """
+    data = _get_json_cached(
+        YTDLP_RELEASE_API,
+        _extract_ytdlp_release,
+        headers=GITHUB_API_HEADERS,
+        max_age=max_age
+    )
+    return VersionInfo(**data) if data else None
+
+
+def check_ytdlp_update(
+    engine_dir: str,
+    max_age: float = REMOTE_CHECK_TTL
+) -> Tuple[bool, str, str]:
     """
     Check if yt-dlp needs to be updated.
     
+    This is a passive status check, so by default the remote version is
+    reused for up to REMOTE_CHECK_TTL seconds.
+    
     Args:
         engine_dir: Path to engine directory
+        max_age: Max age in seconds of a cached remote version (0 = refetch)
     
     Returns:
         (needs_update: bool, local_version: str, remote_version: str)
@@ -236,7 +801,7 @@ def check_ytdlp_update(engine_dir: str) -> Tuple[bool, str, str]:
     ytdlp_path = os.path.join(engine_dir, "yt-dlp.exe")
     
     local_ver = get_local_ytdlp_version(ytdlp_path) or "ไม่พบ"
-    remote_info = get_remote_ytdlp_version()
+    remote_info = get_remote_ytdlp_version(max_age=max_age)
     
     if remote_info is None:
         return (False, local_ver, "ไม่สามารถเช็คได้")
@@ -258,7 +823,8 @@ def check_ytdlp_update(engine_dir: str) -> Tuple[bool, str, str]:
 
 def check_app_update(
     current_version: str,
-    version_url: str
+    version_url: str,
+    max_age: float = 0.0
 ) -> Optional[VersionInfo]:
     """
     Check if the application has a new version available.
@@ -266,14 +832,25 @@ def check_app_update(
     Args:
         current_version: Current app version (e.g., "3.1.0")
         version_url: URL to version.json
+        max_age: Reuse a result younger than this many seconds without
+            a request (0 = always revalidate)
     
     Returns:
         VersionInfo if update available, None if up to date
     """
     try:
-        response = requests.get(version_url, timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json_cached(
+            version_url,
+            lambda d: {
+                "version": d.get("version", ""),
+                "download_url": d.get("download_url", ""),
+                "release_notes": d.get("release_notes", ""),
+                "sha256": str(d.get("sha256", "")).lower(),
+            },
+            max_age=max_age
+        )
+        if not data:
+            return None
         
         remote_version = data.get("version", "")
         if not remote_version:
@@ -285,7 +862,8 @@ def check_app_update(
             return VersionInfo(
                 version=remote_version,
                 download_url=data.get("download_url", ""),
-                release_notes=data.get("release_notes", "")
+                release_notes=data.get("release_notes", ""),
+                sha256=data.get("sha256", "")
             )
         
         return None
@@ -294,108 +872,15 @@ def check_app_update(
         return None
 
 
-def perform_app_update(
-    download_url: str,
-    app_path: str,
-    progress_callback: Optional[ProgressCallback] = None,
-    log_callback: Optional[LogCallback] = None
-) -> UpdateResult:
-    """
-    Update the application using Swap & Restart strategy.
-    
-    Supports both raw .exe files and ZIP packages.
-    
-    Args:
-        download_url: URL to download new version
-        app_path: Path to current .exe
-        progress_callback: Progress update function
-        log_callback: Log message function
-    
-    Returns:
-        UpdateResult with requires_restart=True if successful
-    """
-    def report_progress(label: str, pct: float) -> None:
-        if progress_callback:
-            progress_callback(label, pct)
-    
-    def log(msg: str, level: str = "INFO") -> None:
-        if log_callback:
-            log_callback(msg, level)
-    
-    app_dir = os.path.dirname(app_path)
-    app_name = os.path.basename(app_path)
-    download_temp = os.path.join(app_dir, "_update_download.tmp")
-    extract_dir = os.path.join(app_dir, "_update_extract")
-    batch_path = os.path.join(app_dir, "update.bat")
-    
-    try:
-        # Download
-        log("📥 Downloading new version...", "INFO")
-        report_progress("กำลังดาวน์โหลด...", 10.0)
-        
-        response = requests.get(download_url, stream=True, timeout=120)
-        response.raise_for_status()
-        
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
-        
-        with open(download_temp, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size > 0:
-                    pct = 10.0 + (downloaded / total_size) * 50.0
-                    report_progress(f"ดาวน์โหลด... {downloaded // (1024*1024)} MB", pct)
-        
-        log(f"✓ Download complete: {downloaded} bytes", "INFO")
-        
-        # Check file type
-        report_progress("ตรวจสอบไฟล์...", 65.0)
-        is_zip = zipfile.is_zipfile(download_temp)
-        log(f"   • File type: {'ZIP Package' if is_zip else 'Raw EXE'}", "INFO")
-        
-        if is_zip:
-            # ZIP Package mode
-            report_progress("แตกไฟล์ ZIP...", 70.0)
-            log("📦 Extracting ZIP package...", "INFO")
-            
-            if os.path.exists(extract_dir):
-                shutil.rmtree(extract_dir, ignore_errors=True)
-            os.makedirs(extract_dir, exist_ok=True)
-            
-            with zipfile.ZipFile(download_temp, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            # Find exe in extracted content
-            exe_found = None
-            for root, dirs, files in os.walk(extract_dir):
-                for f in files:
-                    if f.lower().endswith('.exe') and 'infinity' in f.lower():
-                        exe_found = os.path.join(root, f)
-                        break
-                if exe_found:
-                    break
-            
-            if not exe_found:
-                for root, dirs, files in os.walk(extract_dir):
-                    for f in files:
-                        if f.lower().endswith('.exe'):
-                            exe_found = os.path.join(root, f)
-                            break
-                    if exe_found:
-                        break
-            
-            if not exe_found:
-                raise UpdateError("ไม่พบไฟล์ .exe ใน ZIP Package")
-            
-            source_dir = os.path.dirname(exe_found) if os.path.dirname(exe_found) != extract_dir else extract_dir
-            log(f"   • Found EXE: {os.path.basename(exe_found)}", "INFO")
-            
-            # Create batch script for directory merge
-            report_progress("เตรียมการติดตั้ง...", 85.0)
-            log("📝 Creating update script (Directory Merge)...", "INFO")
-            
-            batch_content = f'''@echo off
+# ══════════════════════════════════════════════════════════════════════════════
+# UPDATE SCRIPT TEMPLATES (Swap & Restart)
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Placeholders are filled with str.format_map; every path is already
+# wrapped in double quotes inside the script.
+
+# ZIP package: merge the extracted directory over the install directory
+_BAT_ZIP_TEMPLATE = '''@echo off
 chcp 65001 >nul
 setlocal EnableDelayedExpansion
 
@@ -414,7 +899,9 @@ timeout /t 2 /nobreak >nul
 
 :: [2/4] Install new files
 echo [2/4] Installing new files...
-robocopy "{source_dir}" "{app_dir}" /E /NFL /NDL /NJH /NJS /nc /ns /np 2>nul
+:: /MT:8 copies up to 8 files at once, /J uses unbuffered I/O for large files,
+:: /R:1 /W:1 stop a locked file from stalling the default 1M x 30s retries
+robocopy "{source_dir}" "{app_dir}" /E /MT:8 /J /R:1 /W:1 /NFL /NDL /NJH /NJS /nc /ns /np 2>nul
 if errorlevel 8 (
     xcopy /s /e /y /q "{source_dir}\\*" "{app_dir}\\" 2>nul
 )
@@ -422,7 +909,6 @@ if errorlevel 8 (
 :: [3/4] Cleanup
 echo [3/4] Cleaning up temporary files...
 rmdir /s /q "{extract_dir}" 2>nul
-del /f /q "{download_temp}" 2>nul
 
 :: [4/4] Start app with LOOP_CHECK for file locking
 echo [4/4] Starting application...
@@ -432,7 +918,7 @@ set "RETRY_COUNT=0"
 if not exist "{app_path}" (
     echo.
     echo [ERROR] Application file not found!
-    echo         Path: {app_path}
+    echo         Path: "{app_path}"
     pause
     goto :EOF
 )
@@ -461,21 +947,9 @@ start "Infinity Downloader" /D "{app_dir}" "{app_path}" --post-update
 :: Delete self
 (goto) 2>nul & del "%~f0"
 '''
-        else:
-            # Raw EXE mode
-            new_app_path = os.path.join(app_dir, "app.new.exe")
-            
-            if os.path.exists(new_app_path):
-                os.remove(new_app_path)
-            os.rename(download_temp, new_app_path)
-            
-            if os.path.getsize(new_app_path) < 10000:
-                raise UpdateError("ไฟล์ที่ดาวน์โหลดเสียหาย")
-            
-            report_progress("เตรียมการติดตั้ง...", 85.0)
-            log("📝 Creating update script (Single EXE)...", "INFO")
-            
-            batch_content = f'''@echo off
+
+# Raw EXE: replace the single executable
+_BAT_EXE_TEMPLATE = '''@echo off
 chcp 65001 >nul
 setlocal EnableDelayedExpansion
 
@@ -539,9 +1013,211 @@ start "Infinity Downloader" /D "{app_dir}" "{app_path}" --post-update
 :: Delete self
 (goto) 2>nul & del "%~f0"
 '''
+
+
+def _bat_quote_values(**values: str) -> Dict[str, str]:
+    """
+    Escape values for substitution into a batch script.
+    
+    Quotes keep spaces and & safe, but cmd still expands %VAR% inside
+    them, so literal percent signs are doubled. A double quote cannot
+    be escaped inside a quoted cmd argument at all, so it is refused.
+    
+    Args:
+        **values: Placeholder names and raw values
+    
+    Returns:
+        Dict[str, str]: Escaped values
+    
+    Raises:
+        UpdateError: If a value contains a double quote
+    """
+    for key, value in values.items():
+        if '"' in value:
+            raise UpdateError(f"Unsupported character in {key}: {value}")
+    return {k: v.replace("%", "%%") for k, v in values.items()}
+
+
+def _find_app_exe(names: List[str]) -> Optional[str]:
+    """
+    Pick the application exe from a ZIP member list.
+    
+    Prefers an .exe whose name contains "infinity", otherwise the first
+    .exe. Members that would land outside the extract dir are ignored.
+    
+    Args:
+        names: ZipFile.namelist() entries
+    
+    Returns:
+        str: Member name, or None if the package has no .exe
+    """
+    fallback = None
+    for member in names:
+        if member.startswith(('/', '\\')) or '..' in member.replace('\\', '/').split('/'):
+            continue
+        name = os.path.basename(member).lower()
+        if not name.endswith('.exe'):
+            continue
+        if 'infinity' in name:
+            return member
+        if fallback is None:
+            fallback = member
+    return fallback
+
+
+def perform_app_update(
+    download_url: str,
+    app_path: str,
+    progress_callback: Optional[ProgressCallback] = None,
+    log_callback: Optional[LogCallback] = None,
+    expected_sha256: str = ""
+) -> UpdateResult:
+    """
+    Update the application using Swap & Restart strategy.
+    
+    Supports both raw .exe files and ZIP packages.
+    
+    Args:
+        download_url: URL to download new version
+        app_path: Path to current .exe
+        progress_callback: Progress update function
+        log_callback: Log message function
+        expected_sha256: Hex digest from version.json ("" = not verified)
+    
+    Returns:
+        UpdateResult with requires_restart=True if successful
+    """
+    import hashlib
+    import shutil
+    import tempfile
+    import zipfile
+    
+    def report_progress(label: str, pct: float) -> None:
+        if progress_callback:
+            progress_callback(label, pct)
+    
+    def log(msg: str, level: str = "INFO") -> None:
+        if log_callback:
+            log_callback(msg, level)
+    
+    app_dir = os.path.dirname(app_path)
+    app_name = os.path.basename(app_path)
+    extract_dir = os.path.join(app_dir, "_update_extract")
+    new_app_path = os.path.join(app_dir, "app.new.exe")
+    batch_path = None
+    spool = None
+    
+    try:
+        # Download
+        log("📥 Downloading new version...", "INFO")
+        report_progress("กำลังดาวน์โหลด...", 10.0)
+        
+        # Small packages stay in RAM; larger ones spill to an anonymous
+        # temp file in app_dir. Either way the ZIP is read back from the
+        # same handle instead of a second named file on disk.
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=app_dir)
+        # SHA-256 is fed as bytes arrive on the single-stream path; the
+        # parallel path (large, range-capable packages) hashes the
+        # finished spool once, since slices complete out of order
+        hasher = hashlib.sha256()
+        downloaded = _download_to_file(
+            download_url,
+            spool,
+            progress_callback=progress_callback,
+            base=10.0,
+            span=50.0,
+            unit=(1024 * 1024, "MB"),
+            timeout=120,
+            hasher=hasher,
+            parallel_min_size=PARALLEL_MIN_SIZE
+        )
+        
+        log(f"✓ Download complete: {downloaded} bytes", "INFO")
+        
+        if expected_sha256:
+            if hasher.hexdigest() != expected_sha256.lower():
+                raise UpdateError("ไฟล์ที่ดาวน์โหลดไม่ตรงกับ SHA-256 ที่ประกาศไว้")
+            log("   • SHA-256 verified", "INFO")
         
-        # Write and execute batch
-        with open(batch_path, 'w', encoding='utf-8') as f:
+        # Check file type
+        report_progress("ตรวจสอบไฟล์...", 65.0)
+        spool.seek(0)
+        is_zip = zipfile.is_zipfile(spool)
+        log(f"   • File type: {'ZIP Package' if is_zip else 'Raw EXE'}", "INFO")
+        
+        if is_zip:
+            # ZIP Package mode
+            report_progress("แตกไฟล์ ZIP...", 70.0)
+            log("📦 Extracting ZIP package...", "INFO")
+            
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            os.makedirs(extract_dir, exist_ok=True)
+            
+            spool.seek(0)
+            with zipfile.ZipFile(spool, 'r') as zip_ref:
+                # Locate the exe from the central directory, so the batch
+                # script can be prepared while the files are inflated
+                extraction = _DaemonTask(zip_ref.extractall, extract_dir)
+                try:
+                    exe_member = _find_app_exe(zip_ref.namelist())
+                    if exe_member:
+                        source_dir = os.path.normpath(
+                            os.path.join(extract_dir, os.path.dirname(exe_member))
+                        )
+                        log(f"   • Found EXE: {os.path.basename(exe_member)}", "INFO")
+                        
+                        # Create batch script for directory merge
+                        report_progress("เตรียมการติดตั้ง...", 85.0)
+                        log("📝 Creating update script (Directory Merge)...", "INFO")
+                        
+                        batch_content = _BAT_ZIP_TEMPLATE.format_map(_bat_quote_values(
+                            app_name=app_name,
+                            app_dir=app_dir,
+                            app_path=app_path,
+                            source_dir=source_dir,
+                            extract_dir=extract_dir,
+                        ))
+                    
+                finally:
+                    # Surface extraction errors before anything is launched
+                    extraction.result()
+            
+            if not exe_member:
+                raise UpdateError("ไม่พบไฟล์ .exe ใน ZIP Package")
+        else:
+            # Raw EXE mode: the byte count is already known, no stat needed
+            if downloaded < 10000:
+                raise UpdateError("ไฟล์ที่ดาวน์โหลดเสียหาย")
+            
+            # The batch script needs a real file to move into place
+            spool.seek(0)
+            with open(new_app_path, 'wb') as f:
+                shutil.copyfileobj(spool, f, DOWNLOAD_CHUNK_SIZE)
+            
+            report_progress("เตรียมการติดตั้ง...", 85.0)
+            log("📝 Creating update script (Single EXE)...", "INFO")
+            
+            batch_content = _BAT_EXE_TEMPLATE.format_map(_bat_quote_values(
+                app_name=app_name,
+                app_dir=app_dir,
+                app_path=app_path,
+                new_app_path=new_app_path,
+            ))
+        
+        spool.close()
+        
+        # The window was closed meanwhile: never swap the app behind the user
+        if _SHUTTING_DOWN.is_set():
+            raise UpdateError("Application is closing")
+        
+        # Write and execute batch under a unique name, so two update
+        # attempts never overwrite each other's script. No BOM: cmd would
+        # read it as part of "@echo off"; chcp 65001 handles the paths.
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', prefix="update_", suffix=".bat",
+            dir=app_dir, delete=False
+        ) as f:
+            batch_path = f.name
             f.write(batch_content)
         
         report_progress("เริ่มการติดตั้ง...", 95.0)
@@ -567,16 +1243,16 @@ start "Infinity Downloader" /D "{app_dir}" "{app_path}" --post-update
         log(f"❌ Update failed: {str(e)}", "ERROR")
         report_progress("❌ ล้มเหลว", 0)
         
-        # Cleanup
-        try:
-            if os.path.exists(download_temp):
-                os.remove(download_temp)
-            if os.path.exists(extract_dir):
-                shutil.rmtree(extract_dir, ignore_errors=True)
-            if os.path.exists(batch_path):
-                os.remove(batch_path)
-        except:
-            pass
+        # Cleanup: one unlink attempt per file instead of exists() + remove()
+        if spool is not None:
+            spool.close()
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        for path in (new_app_path, batch_path):
+            if path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
         
         return UpdateResult(
             success=False,
@@ -589,15 +1265,43 @@ start "Infinity Downloader" /D "{app_dir}" "{app_path}" --post-update
 # COMPONENT UPDATE
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _replace_on_reboot(src: str, dst: str) -> bool:
+    """
+    Ask Windows to move src over dst at the next boot.
+    
+    Last resort when dst is locked and cannot even be renamed aside.
+    Registering the move needs write access to the session manager key,
+    so it usually fails without admin rights.
+    
+    Args:
+        src: Downloaded replacement file
+        dst: Locked target file
+    
+    Returns:
+        bool: True if the move was scheduled
+    """
+    if sys.platform != "win32":
+        return False
+    import ctypes
+    
+    MOVEFILE_REPLACE_EXISTING = 0x1
+    MOVEFILE_DELAY_UNTIL_REBOOT = 0x4
+    return bool(ctypes.windll.kernel32.MoveFileExW(
+        src, dst, MOVEFILE_REPLACE_EXISTING | MOVEFILE_DELAY_UNTIL_REBOOT
+    ))
+
+
 def update_component(
     download_url: str,
     target_path: str,
     engine_dir: str,
     progress_callback: Optional[ProgressCallback] = None,
     log_callback: Optional[LogCallback] = None,
-    timeout: int = 60
+    timeout: int = 60,
+    expected_sha256: str = ""
 ) -> bool:
     """Download and update a component with self-healing."""
+    import hashlib
     
     def report_progress(label: str, pct: float) -> None:
         if progress_callback:
@@ -610,54 +1314,85 @@ def update_component(
     filename = os.path.basename(target_path)
     temp_path = os.path.join(engine_dir, f"{os.path.splitext(filename)[0]}.new")
     old_path = os.path.join(engine_dir, f"{os.path.splitext(filename)[0]}.old")
+    # Sidecar naming the URL a partial .new came from; only versioned
+    # release URLs resume (".../latest/..." may point at a newer build)
+    source_path = temp_path + ".src"
+    resumable = "/latest/" not in download_url
+    download_done = False
     
     try:
         os.makedirs(engine_dir, exist_ok=True)
         
-        log(f"📥 Downloading {filename}...", "INFO")
-        report_progress("กำลังดาวน์โหลด...", 5.0)
-        
-        response = requests.get(download_url, stream=True, timeout=timeout)
-        response.raise_for_status()
+        resume_from = 0
+        if resumable:
+            try:
+                with open(source_path, encoding="utf-8") as f:
+                    if f.read() == download_url:
+                        resume_from = os.path.getsize(temp_path)
+            except OSError:
+                pass
         
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
+        if resume_from:
+            log(f"📥 Resuming {filename} from {resume_from // 1024} KB...", "INFO")
+        else:
+            log(f"📥 Downloading {filename}...", "INFO")
+            if resumable:
+                with open(source_path, 'w', encoding="utf-8") as f:
+                    f.write(download_url)
+        report_progress("กำลังดาวน์โหลด...", 5.0)
         
-        with open(temp_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size > 0:
-                    pct = 5.0 + (downloaded / total_size) * 60.0
-                    report_progress(f"ดาวน์โหลด... {downloaded // 1024} KB", pct)
+        hasher = hashlib.sha256() if expected_sha256 else None
+        with open(temp_path, 'r+b' if resume_from else 'wb') as f:
+            downloaded = _download_to_file(
+                download_url,
+                f,
+                progress_callback=progress_callback,
+                base=5.0,
+                span=60.0,
+                timeout=timeout,
+                preallocate=True,
+                resume_from=resume_from,
+                hasher=hasher
+            )
+        download_done = True
         
         log(f"✓ Download complete: {downloaded} bytes", "INFO")
         
         report_progress("ตรวจสอบไฟล์...", 70.0)
-        if os.path.getsize(temp_path) < 1000:
+        if downloaded < 1000:
             raise UpdateError("ไฟล์เสียหาย")
+        if hasher is not None and hasher.hexdigest() != expected_sha256:
+            raise UpdateError("SHA-256 ไม่ตรงกัน ไฟล์เสียหาย")
         
-        report_progress("เปลี่ยนไฟล์...", 80.0)
+        report_progress("ติดตั้งไฟล์ใหม่...", 90.0)
         
-        if os.path.exists(target_path):
+        # os.replace overwrites atomically; if the old file is locked (still
+        # running), rename it aside first - Windows allows renaming an
+        # in-use exe - then move the new one into place
+        pending_reboot = False
+        try:
+            os.replace(temp_path, target_path)
+        except PermissionError:
+            if os.path.exists(old_path):
+                try: os.remove(old_path)
+                except: pass
             try:
-                os.remove(target_path)
+                os.replace(target_path, old_path)
             except PermissionError:
-                try:
-                    subprocess.run(
-                        ["taskkill", "/F", "/IM", filename],
-                        capture_output=True,
-                        creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-                    )
-                    os.remove(target_path)
-                except:
-                    if os.path.exists(old_path):
-                        try: os.remove(old_path)
-                        except: pass
-                    os.rename(target_path, old_path)
+                # Opened without FILE_SHARE_DELETE: not even a rename works
+                if not _replace_on_reboot(temp_path, target_path):
+                    raise
+                pending_reboot = True
+            else:
+                os.replace(temp_path, target_path)
         
-        report_progress("ติดตั้งไฟล์ใหม่...", 90.0)
-        os.rename(temp_path, target_path)
+        try: os.remove(source_path)
+        except OSError: pass
+        
+        if pending_reboot:
+            report_progress("✅ จะอัปเดตหลังรีสตาร์ทเครื่อง", 100.0)
+            log(f"⏳ {filename} is locked - update scheduled for next reboot", "WARNING")
+            return True
         
         report_progress("✅ อัปเดตสำเร็จ!", 100.0)
         log(f"🎉 {filename} update complete!", "SUCCESS")
@@ -666,11 +1401,17 @@ def update_component(
     except Exception as e:
         log(f"❌ Error: {str(e)}", "ERROR")
         report_progress("❌ เกิดข้อผิดพลาด", 0)
-        try:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-        except:
-            pass
+        
+        # A connection that dropped mid-transfer leaves a valid prefix:
+        # keep it (and its sidecar) so the next attempt sends a Range
+        if resumable and not download_done:
+            log("💾 Partial download kept for resume", "INFO")
+        else:
+            for path in (source_path, temp_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
         return False
 
 
@@ -678,11 +1419,36 @@ def update_component(
 # SMART UPDATE FUNCTIONS  
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _matches_release(path: str, info: Optional[VersionInfo]) -> Optional[bool]:
+    """
+    Compare a local file with the size and SHA-256 listed for a release.
+    
+    The size is checked first, so a clearly different file is never hashed.
+    
+    Args:
+        path: Local file
+        info: Release metadata
+    
+    Returns:
+        bool: Whether the file is identical to the release asset, or
+        None if the release lists no size/digest to compare against
+    """
+    if not (info and info.size and info.sha256):
+        return None
+    try:
+        if os.path.getsize(path) != info.size:
+            return False
+    except OSError:
+        return False
+    return file_sha256(path) == info.sha256
+
+
 def update_ytdlp(
     engine_dir: str,
     progress_callback: Optional[ProgressCallback] = None,
     log_callback: Optional[LogCallback] = None,
-    force: bool = False
+    force: bool = False,
+    prefetched: Optional[Tuple[Optional[str], Optional[VersionInfo]]] = None
 ) -> bool:
     """
     Smart update for yt-dlp - checks version before downloading.
@@ -692,6 +1458,8 @@ def update_ytdlp(
         progress_callback: Progress update function
         log_callback: Log message function
         force: Force download even if up to date
+        prefetched: (local_version, remote_info) already looked up by the
+            caller; skips the version checks here
     
     Returns:
         bool: True if successful (including "already up to date")
@@ -711,8 +1479,11 @@ def update_ytdlp(
     log("🔍 Checking yt-dlp version...", "INFO")
     
     file_exists = os.path.exists(ytdlp_path)
-    local_ver = get_local_ytdlp_version(ytdlp_path)
-    remote_info = get_remote_ytdlp_version()
+    if prefetched is not None:
+        local_ver, remote_info = prefetched
+    else:
+        local_ver = get_local_ytdlp_version(ytdlp_path)
+        remote_info = get_remote_ytdlp_version()
     
     if local_ver:
         log(f"   • Local version: {local_ver}", "INFO")
@@ -741,9 +1512,16 @@ def update_ytdlp(
         report("✅ ใช้เวอร์ชันปัจจุบัน", 100.0)
         return True
     elif not local_ver and file_exists and not force:
-        log("   • ✅ Skipping update (version check failed but file exists)", "SUCCESS")
-        report("✅ ใช้ไฟล์ปัจจุบัน", 100.0)
-        return True
+        # `--version` failed: a truncated or damaged binary looks exactly
+        # like this, so repair it when it differs from the release
+        if _matches_release(ytdlp_path, remote_info) is False:
+            needs_update = True
+            download_url = remote_info.download_url
+            log("   • 🛠️ Local file differs from the release, reinstalling", "WARNING")
+        else:
+            log("   • ✅ Skipping update (version check failed but file exists)", "SUCCESS")
+            report("✅ ใช้ไฟล์ปัจจุบัน", 100.0)
+            return True
     elif local_ver and remote_info:
         comparison = compare_versions(local_ver, remote_info.version)
         if comparison < 0:
@@ -759,14 +1537,26 @@ def update_ytdlp(
         report("✅ ล่าสุดแล้ว!", 100.0)
         return True
     
-    # Download and install
+    # force=True reinstall of the very same binary: the release lists
+    # size and SHA-256, so an identical local file needs no download
+    if force and file_exists and _matches_release(ytdlp_path, remote_info):
+        log("   • ✅ Local binary is identical to the release, skipping download", "SUCCESS")
+        report("✅ ล่าสุดแล้ว!", 100.0)
+        return True
+    
+    # Download and install; the release digest only describes its own asset
     return update_component(
         download_url=download_url,
         target_path=ytdlp_path,
         engine_dir=engine_dir,
         progress_callback=progress_callback,
         log_callback=log_callback,
-        timeout=60
+        timeout=60,
+        expected_sha256=(
+            remote_info.sha256
+            if remote_info and download_url == remote_info.download_url
+            else ""
+        )
     )
 
 
@@ -815,13 +1605,23 @@ def run_full_update_routine(
     
     log("🔄 Starting update check...", "INFO")
     
-    # Check App Update
-    if not skip_app_update and app_version_url:
+    check_app = not skip_app_update and bool(app_version_url)
+    
+    # All three lookups are independent I/O (HTTP, HTTP, subprocess):
+    # run them concurrently so the check phase costs max(), not sum()
+    f_app = _DaemonTask(check_app_update, app_version, app_version_url) if check_app else None
+    f_local = _DaemonTask(get_local_ytdlp_version, os.path.join(engine_dir, "yt-dlp.exe"))
+    f_remote = _DaemonTask(get_remote_ytdlp_version)
+    
+    if check_app:
         report("ตรวจสอบอัปเดตโปรแกรม...", 5.0)
         log("📱 Checking app version...", "INFO")
-        
-        app_update = check_app_update(app_version, app_version_url)
-        
+    
+    app_update = f_app.result() if f_app else None
+    ytdlp_versions = (f_local.result(), f_remote.result())
+    
+    # Check App Update
+    if check_app:
         if app_update:
             log(f"🆕 New version found: {app_update.version}", "INFO")
             log("   Preparing app update...", "INFO")
@@ -830,7 +1630,8 @@ def run_full_update_routine(
                 download_url=app_update.download_url,
                 app_path=app_path,
                 progress_callback=progress_callback,
-                log_callback=log_callback
+                log_callback=log_callback,
+                expected_sha256=app_update.sha256
             )
             
             if result.success and result.requires_restart:
@@ -847,7 +1648,8 @@ def run_full_update_routine(
     success = update_ytdlp(
         engine_dir=engine_dir,
         progress_callback=progress_callback,
-        log_callback=log_callback
+        log_callback=log_callback,
+        prefetched=ytdlp_versions
     )
     
     if success:
@@ -2,13 +2,33 @@
 UI Package - User Interface Components (CustomTkinter)
 """
 
-from .app import InfinityMP3Downloader
-from .dialogs import FirstRunPathDialog, DependencySetupDialog
-from .widgets import create_context_menu
+# Names are resolved lazily (PEP 562): importing one submodule (e.g.
+# src.ui.widgets) does not drag in the whole app and every dialog.
+_LAZY_EXPORTS = {
+    "InfinityMP3Downloader": ".app",
+    "FirstRunPathDialog": ".dialogs",
+    "DependencySetupDialog": ".dialogs",
+    "install_global_context_menu": ".widgets",
+    "screen_size": ".widgets",
+    "show_toast": ".widgets",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "InfinityMP3Downloader",
     "FirstRunPathDialog",
     "DependencySetupDialog",
-    "create_context_menu",
+    "install_global_context_menu",
+    "screen_size",
+    "show_toast",
 ]
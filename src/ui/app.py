@@ -12,10 +12,12 @@
 
 import os
 import sys
-import ctypes
-from datetime import datetime
-from tkinter import filedialog, messagebox
-from typing import Optional
+import queue
+import threading
+import time
+from collections import deque
+from tkinter import messagebox
+from typing import Any, Callable, Deque, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -28,13 +30,38 @@ from src.utils.paths import (
     UPDATE_JSON_URL,
     is_frozen,
     get_icon_path,
+    engine_has,
 )
 from src.utils.fonts import FontLoader
+from src.utils.debug import debug_print
 from src.core.settings import SettingsManager
-from src.core.downloader import Downloader, run_in_thread
-from src.core.updater import run_full_update_routine
+from src.core.downloader import Downloader, is_youtube_url, run_in_thread
 from src.ui.dialogs import FirstRunPathDialog, DependencySetupDialog
-from src.ui.widgets import create_context_menu
+from src.ui.widgets import install_global_context_menu, show_toast, update_readonly_entry
+
+
+# Interval of the UI pump that applies worker-thread events in one batch
+# (queued calls, latest progress value, pending log lines) - ~30 Hz
+UI_PUMP_MS: int = 33
+
+# Max log lines kept in memory while the log panel is collapsed
+LOG_BUFFER_MAX: int = 2000
+
+# "0.0%" ... "100.0%", indexed by tenths of a percent
+PCT_STRINGS: Tuple[str, ...] = tuple(f"{i / 10:.1f}%" for i in range(1001))
+
+
+# Initial folder for the browse dialog when no folder is chosen yet
+_HOME_DIR: str = os.path.expanduser("~")
+
+
+# Log level -> icon prefix
+LOG_PREFIX = {
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "❌"
+}
 
 
 # Set UI Theme
@@ -59,71 +86,134 @@ class InfinityMP3Downloader(ctk.CTk):
         super().__init__()
         
         # ═══════════════════════════════════════════════════════════════════════
-        # STEP 1: Load fonts after root window creation
-        # ═══════════════════════════════════════════════════════════════════════
-        self.font_family, self.is_custom_font = FontLoader.load()
-        self._setup_fonts()
-        
-        # ═══════════════════════════════════════════════════════════════════════
-        # STEP 2: Load settings and sync checkbox state
+        # STEP 1: Load settings and sync checkbox state
         # ═══════════════════════════════════════════════════════════════════════
         settings = SettingsManager.load()
         self.output_dir: str = settings.get("download_path", "")
         self._path_is_saved: bool = bool(self.output_dir)
         
         # ═══════════════════════════════════════════════════════════════════════
-        # STEP 3: Window configuration
+        # STEP 2: Window configuration
         # ═══════════════════════════════════════════════════════════════════════
         self.title(f"∞ Infinity MP3 Downloader v{APP_VERSION}")
         self.geometry("780x550")
         self.minsize(720, 450)
         
         # ═══════════════════════════════════════════════════════════════════════
-        # STEP 4: App Icon (Taskbar Fix for Windows)
+        # STEP 3: Taskbar ID (must be set before the window is shown)
         # ═══════════════════════════════════════════════════════════════════════
-        try:
-            myappid = f'weera.infinity.downloader.v{APP_VERSION}'
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-            print(f"✅ Taskbar ID set: {myappid}")
-        except Exception as e:
-            print(f"⚠️ Failed to set taskbar ID: {e}")
-        
-        icon_path = get_icon_path()
-        if icon_path:
+        if sys.platform == "win32":
+            # ctypes is only imported where the shell32 call exists
+            import ctypes
             try:
-                self.iconbitmap(icon_path)
-                print(f"✅ App icon loaded: {icon_path}")
+                myappid = f'weera.infinity.downloader.v{APP_VERSION}'
+                ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+                debug_print(f"✅ Taskbar ID set: {myappid}")
             except Exception as e:
-                print(f"⚠️ Failed to load icon: {e}")
+                print(f"⚠️ Failed to set taskbar ID: {e}")
         
         # ═══════════════════════════════════════════════════════════════════════
-        # STEP 5: State variables
+        # STEP 4: State variables
         # ═══════════════════════════════════════════════════════════════════════
         self.is_downloading: bool = False
         self.is_updating: bool = False
         self.downloader: Optional[Downloader] = None
         self.log_visible: bool = False
+        self.log_container: Optional[ctk.CTkFrame] = None
+        self.log_textbox: Optional[ctk.CTkTextbox] = None
+        
+        # Worker threads never touch Tk: they enqueue and _pump_events
+        # applies everything on the Tk thread once per UI_PUMP_MS tick
+        self._event_q: "queue.SimpleQueue[Tuple[Callable[..., Any], tuple]]" = queue.SimpleQueue()
+        self._ui_lock = threading.Lock()
+        # Bounded: while the log is hidden only the newest lines are kept
+        self._log_buf: Deque[str] = deque(maxlen=LOG_BUFFER_MAX)
+        self._ts_epoch: int = 0
+        self._ts_str: str = ""
+        self._pending_progress: Optional[Tuple[str, Optional[float]]] = None
+        self._shown_label: Optional[str] = None
+        self._shown_pct: Optional[int] = None  # tenths of a percent
+        self._last_path_shown: Optional[str] = None
+        self._last_busy: Optional[Tuple[bool, bool]] = None  # (busy, stoppable)
+        
+        # Let the empty themed window paint first; fonts, icon and widgets
+        # are resolved on the next Tk cycle
+        self.after(1, self._post_paint_init)
+    
+    def _post_paint_init(self) -> None:
+        """Load fonts and icon, build the UI and start (after first paint)."""
+        # ═══════════════════════════════════════════════════════════════════════
+        # STEP 5: Load fonts after root window creation
+        # ═══════════════════════════════════════════════════════════════════════
+        settings = SettingsManager.load()
+        cached_family = settings.get("font_family", "")
+        self.font_family, self.is_custom_font = FontLoader.load(preferred=cached_family)
+        if not self.is_custom_font and self.font_family != cached_family:
+            # Memoize the probed family so the next launch skips the probe
+            SettingsManager.update(font_family=self.font_family)
+        self._setup_fonts()
+        
+        # ═══════════════════════════════════════════════════════════════════════
+        # STEP 6: App Icon (Windows shell icon-cache lookup can block)
+        # ═══════════════════════════════════════════════════════════════════════
+        # Applied once the widgets below have been mapped
+        self.after_idle(self._apply_windows_chrome)
         
         # Build UI and start
         self._build_ui()
+        self.after(UI_PUMP_MS, self._pump_events)
         self.after(200, self._startup_sequence)
+        
+        # Prefetch on-demand modules while the user reads the UI
+        threading.Thread(target=self._warm_imports, daemon=True).start()
+    
+    def _apply_windows_chrome(self) -> None:
+        """Load the window icon (deferred off the first-paint path)."""
+        icon_path = get_icon_path()
+        if icon_path:
+            try:
+                self.iconbitmap(icon_path)
+                debug_print(f"✅ App icon loaded: {icon_path}")
+            except Exception as e:
+                print(f"⚠️ Failed to load icon: {e}")
+    
+    @staticmethod
+    def _warm_imports() -> None:
+        """
+        Import modules deferred off the startup path (browse/update).
+        
+        Runs on a daemon thread so the first click finds them already
+        in sys.modules. No Tk calls are made here.
+        """
+        try:
+            import tkinter.filedialog  # noqa: F401
+            import src.core.updater  # noqa: F401
+            import requests  # noqa: F401  (updater imports it lazily)
+        except Exception as e:
+            debug_print(f"⚠️ Import prefetch failed: {e}")
     
     def _setup_fonts(self) -> None:
-        """Configure font tuples based on loaded font family."""
+        """
+        Create shared CTkFont instances based on loaded font family.
+        
+        One CTkFont per (size, weight) is reused by every widget so Tk
+        resolves each font once instead of parsing a tuple per widget.
+        """
         ff = self.font_family
-        if self.is_custom_font:
-            self.FONT_NORMAL = (ff, 18)
-            self.FONT_BOLD = (ff, 18, "bold")
-            self.FONT_HEADER = (ff, 26, "bold")
-            self.FONT_SUBTITLE = (ff, 15)
-            self.FONT_SMALL = (ff, 14)
-        else:
-            self.FONT_NORMAL = (ff, 14)
-            self.FONT_BOLD = (ff, 14, "bold")
-            self.FONT_HEADER = (ff, 22, "bold")
-            self.FONT_SUBTITLE = (ff, 12)
-            self.FONT_SMALL = (ff, 11)
-        self.FONT_LOG = ("Consolas", 12)
+        sizes = FontLoader.get_font_sizes(self.is_custom_font)
+        self.FONT_NORMAL = ctk.CTkFont(family=ff, size=sizes["normal"])
+        self.FONT_BOLD = ctk.CTkFont(family=ff, size=sizes["bold"], weight="bold")
+        self.FONT_HEADER = ctk.CTkFont(family=ff, size=sizes["header"], weight="bold")
+        # Window title is always 26 bold; share FONT_HEADER when it matches
+        self.FONT_TITLE = (
+            self.FONT_HEADER if sizes["header"] == 26
+            else ctk.CTkFont(family=ff, size=26, weight="bold")
+        )
+        self.FONT_SUBTITLE = ctk.CTkFont(family=ff, size=sizes["subtitle"])
+        self.FONT_SMALL = ctk.CTkFont(family=ff, size=sizes["small"])
+        self.FONT_LOG = ctk.CTkFont(family="Consolas", size=12)
+        # Plain tk.Menu does not apply CTk scaling, so it keeps a tuple spec
+        self.FONT_MENU = (ff, sizes["normal"])
     
     def _build_ui(self) -> None:
         """Build the main application UI."""
@@ -140,7 +230,7 @@ class InfinityMP3Downloader(ctk.CTk):
         title = ctk.CTkLabel(
             header,
             text="∞ Infinity MP3 Downloader",
-            font=ctk.CTkFont(family=self.font_family, size=26, weight="bold")
+            font=self.FONT_TITLE
         )
         title.pack(anchor="w")
         
@@ -175,8 +265,8 @@ class InfinityMP3Downloader(ctk.CTk):
         )
         self.url_entry.grid(row=1, column=0, padx=15, sticky="ew")
         
-        # Add context menu with Thai keyboard support
-        create_context_menu(self.url_entry, font=self.FONT_NORMAL)
+        # Context menu with Thai keyboard support, shared by every text field
+        install_global_context_menu(self, font=self.FONT_MENU)
         
         # Buttons row
         btn_row = ctk.CTkFrame(input_section, fg_color="transparent")
@@ -299,27 +389,8 @@ class InfinityMP3Downloader(ctk.CTk):
         self.progress_pct.pack(side="right")
         
         # ══════════════════════════════════════════════════════════════════════
-        # 5. LOG SECTION (Collapsible)
+        # 5. LOG SECTION (Collapsible, built on first show - _build_log_section)
         # ══════════════════════════════════════════════════════════════════════
-        self.log_container = ctk.CTkFrame(self)
-        
-        log_header = ctk.CTkFrame(self.log_container, fg_color="transparent")
-        log_header.pack(fill="x", padx=15, pady=(12, 5))
-        
-        log_title = ctk.CTkLabel(
-            log_header,
-            text="📋 บันทึกการทำงาน",
-            font=self.FONT_BOLD
-        )
-        log_title.pack(side="left")
-        
-        self.log_textbox = ctk.CTkTextbox(
-            self.log_container,
-            font=self.FONT_LOG,
-            wrap="word",
-            corner_radius=8
-        )
-        self.log_textbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
         
         # ══════════════════════════════════════════════════════════════════════
         # 6. STATUS BAR
@@ -383,7 +454,10 @@ class InfinityMP3Downloader(ctk.CTk):
     
     def _check_dependencies(self) -> None:
         """Check if dependencies are installed."""
-        if not os.path.exists(YTDLP_PATH) or not os.path.exists(FFMPEG_PATH):
+        if not (
+            engine_has(os.path.basename(YTDLP_PATH))
+            and engine_has(os.path.basename(FFMPEG_PATH))
+        ):
             self.log("⚠️ ติดตั้งระบบ...", "WARNING")
             DependencySetupDialog(
                 self,
@@ -406,17 +480,20 @@ class InfinityMP3Downloader(ctk.CTk):
     # ══════════════════════════════════════════════════════════════════════════
     
     def _update_path_display(self) -> None:
-        """Update the path display entry."""
-        self.path_display.configure(state="normal")
-        self.path_display.delete(0, "end")
-        self.path_display.insert(0, self.output_dir or "(ยังไม่ได้เลือก)")
-        self.path_display.configure(state="readonly")
+        """Update the path display entry (no-op if the text is unchanged)."""
+        text = self.output_dir or "(ยังไม่ได้เลือก)"
+        if text == self._last_path_shown:
+            return
+        self._last_path_shown = text
+        update_readonly_entry(self.path_display, text)
     
     def _browse_folder(self) -> None:
         """Open folder selection dialog."""
+        from tkinter import filedialog
+        
         folder = filedialog.askdirectory(
             title="เลือกโฟลเดอร์ปลายทาง",
-            initialdir=self.output_dir or os.path.expanduser("~")
+            initialdir=self.output_dir or _HOME_DIR
         )
         if folder:
             self.output_dir = folder
@@ -446,69 +523,167 @@ class InfinityMP3Downloader(ctk.CTk):
     # UI STATE MANAGEMENT
     # ══════════════════════════════════════════════════════════════════════════
     
+    def _post(self, func: Callable[..., Any], *args: Any) -> None:
+        """Queue a call for the Tk thread (thread-safe, applied by _pump_events)."""
+        self._event_q.put((func, args))
+    
     def _show_progress(self) -> None:
         """Show the progress bar."""
-        def _show():
-            self.progress_frame.grid(row=3, column=0, padx=25, pady=10, sticky="ew")
-            self.progress_bar.set(0)
-        self.after(0, _show)
+        self._post(self._show_progress_impl)
+    
+    def _show_progress_impl(self) -> None:
+        self.progress_frame.grid(row=3, column=0, padx=25, pady=10, sticky="ew")
+        self.progress_bar.set(0)
+        self._shown_pct = None
     
     def _hide_progress(self, delay_ms: int = 2000) -> None:
         """Hide the progress bar after delay."""
-        def _hide():
-            self.progress_frame.grid_forget()
-            self.progress_bar.set(0)
-            self.progress_pct.configure(text="")
-        self.after(delay_ms, _hide)
+        self._post(self.after, delay_ms, self._hide_progress_impl)
+    
+    def _hide_progress_impl(self) -> None:
+        self.progress_frame.grid_forget()
+        # Bar is reset by _show_progress_impl on the next show
+        self.progress_pct.configure(text="")
+        self._shown_pct = None
+    
+    def _build_log_section(self) -> None:
+        """Create the log panel (deferred until the user first opens it)."""
+        self.log_container = ctk.CTkFrame(self)
+        
+        log_header = ctk.CTkFrame(self.log_container, fg_color="transparent")
+        log_header.pack(fill="x", padx=15, pady=(12, 5))
+        
+        log_title = ctk.CTkLabel(
+            log_header,
+            text="📋 บันทึกการทำงาน",
+            font=self.FONT_BOLD
+        )
+        log_title.pack(side="left")
+        
+        self.log_textbox = ctk.CTkTextbox(
+            self.log_container,
+            font=self.FONT_LOG,
+            wrap="word",
+            corner_radius=8
+        )
+        self.log_textbox.pack(fill="both", expand=True, padx=15, pady=(0, 15))
     
     def _toggle_log(self) -> None:
         """Toggle log visibility."""
+        if self.log_container is None:
+            self._build_log_section()
+        
         if self.log_visible:
             self.log_container.grid_forget()
             self.toggle_log_btn.configure(text="📝 แสดง Log")
-            self.geometry("780x550")
             self.log_visible = False
         else:
             self.log_container.grid(row=4, column=0, padx=25, pady=(0, 10), sticky="nsew")
             self.toggle_log_btn.configure(text="📝 ซ่อน Log")
-            self.geometry("780x700")
             self.log_visible = True
+            # Lines buffered while hidden are written in one insert
+            self._flush_log_buffer()
+        # One resize once grid has settled; keeps the user's width
+        self.after_idle(self._fit_height)
+    
+    def _fit_height(self) -> None:
+        """Resize the window to the height the grid requests."""
+        # wm_geometry takes raw pixels like winfo_* (CTk's geometry() rescales)
+        self.wm_geometry(f"{self.winfo_width()}x{self.winfo_reqheight()}")
     
     def log(self, message: str, level: str = "INFO") -> None:
-        """Add a log message."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        prefix = {
-            "INFO": "ℹ️",
-            "SUCCESS": "✅",
-            "WARNING": "⚠️",
-            "ERROR": "❌"
-        }.get(level, "•")
-        formatted = f"[{timestamp}] {prefix} {message}\n"
-        
-        def _update():
-            self.log_textbox.insert("end", formatted)
-            self.log_textbox.see("end")
-        self.after(0, _update)
+        """Add a log message (thread-safe, batched by the log drainer)."""
+        # Reformat the timestamp at most once per second
+        now = int(time.time())
+        if now != self._ts_epoch:
+            self._ts_epoch = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        prefix = LOG_PREFIX.get(level, "•")
+        formatted = f"[{self._ts_str}] {prefix} {message}\n"
+        
+        # deque.append is atomic: no lock needed, drained by _pump_events
+        self._log_buf.append(formatted)
+    
+    def _pump_events(self) -> None:
+        """Apply all pending worker-thread events in one Tk pass, then re-arm."""
+        try:
+            while True:
+                func, args = self._event_q.get_nowait()
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"⚠️ UI event failed: {e}")
+        except queue.Empty:
+            pass
+        self._flush_progress()
+        if self.log_visible:
+            self._flush_log_buffer()
+        self.after(UI_PUMP_MS, self._pump_events)
+    
+    def _flush_log_buffer(self) -> None:
+        """Insert all pending log lines with a single Text insert."""
+        if not self._log_buf:
+            return
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_buf.popleft())
+        except IndexError:
+            pass
+        self.log_textbox.insert("end", "".join(lines))
+        self.log_textbox.see("end")
     
     def update_progress(self, label: str, percentage: Optional[float] = None) -> None:
-        """Update progress display (thread-safe)."""
-        def _update():
+        """Update progress display (thread-safe, latest value wins, ~30 Hz)."""
+        with self._ui_lock:
+            self._pending_progress = (label, percentage)
+    
+    def _flush_progress(self) -> None:
+        """Apply only the latest pending progress update."""
+        if self._pending_progress is None:
+            return
+        with self._ui_lock:
+            pending = self._pending_progress
+            self._pending_progress = None
+        if pending is None:
+            return
+        label, percentage = pending
+        # Skip Tk round-trips for values already on screen
+        if label != self._shown_label:
+            self._shown_label = label
             self.progress_label.configure(text=label)
-            if percentage is not None:
-                self.progress_bar.set(percentage / 100.0)
-                self.progress_pct.configure(text=f"{percentage:.1f}%")
+        idx = None if percentage is None else min(1000, max(0, int(percentage * 10 + 0.5)))
+        if idx != self._shown_pct:
+            self._shown_pct = idx
+            if idx is not None:
+                self.progress_bar.set(idx / 1000.0)
+                self.progress_pct.configure(text=PCT_STRINGS[idx])
             else:
                 self.progress_pct.configure(text="")
-        self.after(0, _update)
     
-    def set_buttons_state(self, busy: bool = False) -> None:
-        """Set button states based on busy status."""
+    def _toast(self, title: str, message: str) -> None:
+        """Show a self-closing, non-modal notification."""
+        show_toast(self, title, message, font=self.FONT_NORMAL)
+    
+    def set_buttons_state(self, busy: bool = False, stoppable: bool = True) -> None:
+        """
+        Set button states based on busy status.
+        
+        Args:
+            busy: A background job is running (Download/Update disabled)
+            stoppable: The job can be cancelled (Stop enabled while busy)
+        """
         def _update():
+            # Repeated calls with the same state cost no Tk round-trips
+            wanted = (busy, busy and stoppable)
+            if wanted == self._last_busy:
+                return
+            self._last_busy = wanted
             state = "disabled" if busy else "normal"
             self.download_btn.configure(state=state)
             self.update_btn.configure(state=state)
-            self.stop_btn.configure(state="normal" if busy else "disabled")
-        self.after(0, _update)
+            self.stop_btn.configure(state="normal" if wanted[1] else "disabled")
+        self._post(_update)
     
     # ══════════════════════════════════════════════════════════════════════════
     # EVENT HANDLERS
@@ -520,10 +695,14 @@ class InfinityMP3Downloader(ctk.CTk):
         if not url:
             messagebox.showwarning("ไม่พบลิงก์", "กรุณาวาง URL")
             return
+        if not is_youtube_url(url):
+            self.log(f"URL ไม่ถูกต้อง: {url[:60]}", "ERROR")
+            messagebox.showwarning("ลิงก์ไม่ถูกต้อง", "กรุณาวางลิงก์ YouTube ที่ถูกต้อง")
+            return
         if not self.output_dir:
             messagebox.showwarning("ไม่พบโฟลเดอร์", "กรุณาเลือกโฟลเดอร์ก่อน")
             return
-        if not os.path.exists(YTDLP_PATH):
+        if not engine_has(os.path.basename(YTDLP_PATH)):
             messagebox.showerror("ไม่พบระบบ", "กรุณากด 'อัปเดต'")
             return
         
@@ -536,21 +715,24 @@ class InfinityMP3Downloader(ctk.CTk):
         """Handle update button click."""
         if messagebox.askyesno("อัปเดต?", "ดาวน์โหลด yt-dlp ล่าสุด?"):
             self.is_updating = True
-            self.set_buttons_state(busy=True)
+            # An update cannot be cancelled halfway: no Stop button
+            self.set_buttons_state(busy=True, stoppable=False)
             self._show_progress()
             self._start_update()
     
     def _on_stop(self) -> None:
         """Handle stop button click."""
+        if not self.is_downloading:
+            return
+        # Jobs run one at a time on the worker thread: the buttons come back
+        # from _start_download's finally once the cancelled job has ended,
+        # so a new click can never queue up behind it
+        self.is_downloading = False
         if self.downloader:
             self.downloader.cancel()
-            self.log("⏹️ หยุด...", "WARNING")
-        
-        self.is_downloading = False
-        self.is_updating = False
-        self.set_buttons_state(busy=False)
+        self.log("⏹️ หยุด...", "WARNING")
+        self.set_buttons_state(busy=True, stoppable=False)
         self.update_progress("หยุดแล้ว", 0)
-        self._hide_progress(1000)
     
     # ══════════════════════════════════════════════════════════════════════════
     # DOWNLOAD LOGIC (Using Optimized Downloader)
@@ -569,12 +751,18 @@ class InfinityMP3Downloader(ctk.CTk):
                 use_aria2c=False  # Set to True if user has aria2c
             )
             
+            # Stop was pressed before there was a downloader to cancel
+            if not self.is_downloading:
+                self._hide_progress(1000)
+                return
+            
             result = self.downloader.download(url)
             
             if result.success:
-                self.after(0, lambda: messagebox.showinfo("สำเร็จ", "ดาวน์โหลดเรียบร้อย!"))
-            else:
-                self.after(0, lambda: messagebox.showerror("ล้มเหลว", result.message))
+                self._post(self._toast, "สำเร็จ", "ดาวน์โหลดเรียบร้อย!")
+            elif self.is_downloading:
+                # (a user-requested stop is not reported as a failure)
+                self._post(messagebox.showerror, "ล้มเหลว", result.message)
             
             self._hide_progress()
             
@@ -591,6 +779,10 @@ class InfinityMP3Downloader(ctk.CTk):
     def _start_update(self) -> None:
         """Start update routine in background thread."""
         try:
+            # Deferred: pulls in requests/zipfile, only needed on update.
+            # Inside the try, so a broken build is logged and the UI reset
+            from src.core.updater import run_full_update_routine
+            
             # Detect running mode
             if is_frozen():
                 app_path = sys.executable
@@ -604,8 +796,6 @@ class InfinityMP3Downloader(ctk.CTk):
                 self.log("   • รันจากซอร์สโค้ด .py", "INFO")
                 self.log("   • จะตรวจสอบเฉพาะ yt-dlp เท่านั้น", "INFO")
                 self.log("━" * 50, "INFO")
-                import time
-                time.sleep(1)
             
             self.log(f"📌 App Version: {APP_VERSION}", "INFO")
             
@@ -621,17 +811,18 @@ class InfinityMP3Downloader(ctk.CTk):
             
             if result.requires_restart:
                 self.log("🔄 โปรแกรมจะปิดและเปิดใหม่อัตโนมัติ...", "SUCCESS")
-                self.after(0, lambda: messagebox.showinfo(
+                self._post(
+                    self._toast,
                     "กำลังอัปเดต",
                     "โปรแกรมจะปิดและเปิดใหม่อัตโนมัติเพื่อติดตั้งเวอร์ชันใหม่"
-                ))
-                self.after(1500, lambda: sys.exit(0))
+                )
+                self._post(self.after, 1500, lambda: sys.exit(0))
                 return
             
             if result.success:
-                self.after(0, lambda: messagebox.showinfo("สำเร็จ", result.message))
+                self._post(self._toast, "สำเร็จ", result.message)
             else:
-                self.after(0, lambda: messagebox.showwarning("แจ้งเตือน", result.message))
+                self._post(messagebox.showwarning, "แจ้งเตือน", result.message)
             
             self._hide_progress()
             
@@ -8,26 +8,105 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
 import os
-import io
-import shutil
-import zipfile
-import requests
-from typing import Callable, Tuple
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
 
 from src.utils.paths import (
-    ENGINE_DIR,
     YTDLP_PATH,
     FFMPEG_PATH,
     FFPROBE_PATH,
     YTDLP_DOWNLOAD_URL,
     FFMPEG_DOWNLOAD_URL,
+    YTDLP_SHA256_URL,
+    FFMPEG_SHA256_URL,
+    engine_has,
+    ensure_engine_dir,
 )
 from src.core.settings import SettingsManager
 from src.core.downloader import run_in_thread
+from src.ui.widgets import screen_size, update_readonly_entry
+
+
+# Minimum interval between progress UI updates during downloads (~30Hz)
+UI_UPDATE_INTERVAL: float = 0.033
+
+
+@functools.lru_cache(maxsize=None)
+def _dialog_font(family: str, size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Get a shared CTkFont for dialog widgets.
+    
+    Both dialogs ask for the same few (family, size, weight) specs, so
+    each font is built and measured by Tk once per process instead of
+    once per widget or per dialog.
+    
+    Args:
+        family: Font family name
+        size: Font size
+        weight: "normal" or "bold"
+        
+    Returns:
+        ctk.CTkFont: Cached font object
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
+
+
+def _run_daemon_jobs(
+    jobs: List[Tuple[Callable, tuple]]
+) -> Iterator[Tuple[Any, Optional[BaseException]]]:
+    """
+    Run jobs concurrently on daemon threads, yielding outcomes as they end.
+    
+    Daemon threads (not ThreadPoolExecutor, whose workers are joined at
+    interpreter exit) let closing the dialog end the process at once,
+    even while a read is stalled or FFmpeg is being inflated.
+    
+    Args:
+        jobs: (function, args) pairs
+    
+    Yields:
+        Tuple[Any, Optional[BaseException]]: (result, error) per job,
+        in completion order
+    """
+    import queue
+    
+    done: "queue.SimpleQueue" = queue.SimpleQueue()
+    
+    def run(fn: Callable, args: tuple) -> None:
+        try:
+            done.put((fn(*args), None))
+        except BaseException as e:
+            done.put((None, e))
+    
+    for fn, args in jobs:
+        threading.Thread(target=run, args=(fn, args), daemon=True).start()
+    for _ in jobs:
+        yield done.get()
+
+
+def _exit_app(dialog: ctk.CTkToplevel) -> None:
+    """
+    Tear down the dialog and its parent window, then exit cleanly.
+    
+    Unlike os._exit(), this lets Tk release its resources and runs
+    atexit handlers / file flushes before the interpreter stops.
+    
+    Args:
+        dialog: The dialog requesting application exit
+    """
+    parent = dialog.master
+    dialog.destroy()
+    try:
+        parent.destroy()
+    except Exception:
+        pass
+    sys.exit(0)
 
 
 class FirstRunPathDialog(ctk.CTkToplevel):
@@ -60,31 +139,29 @@ class FirstRunPathDialog(ctk.CTkToplevel):
         self.selected_path: str | None = None
         self.font_family = font_family
         
-        # Font configuration
+        # Font configuration (shared CTkFont objects)
         if is_custom:
-            self.FONT_NORMAL = (font_family, 18)
-            self.FONT_BOLD = (font_family, 18, "bold")
-            self.FONT_HEADER = (font_family, 28, "bold")
-            self.FONT_SMALL = (font_family, 14)
+            self.FONT_NORMAL = _dialog_font(font_family, 18)
+            self.FONT_BOLD = _dialog_font(font_family, 18, "bold")
+            self.FONT_HEADER = _dialog_font(font_family, 28, "bold")
+            self.FONT_SMALL = _dialog_font(font_family, 14)
         else:
-            self.FONT_NORMAL = (font_family, 14)
-            self.FONT_BOLD = (font_family, 14, "bold")
-            self.FONT_HEADER = (font_family, 22, "bold")
-            self.FONT_SMALL = (font_family, 11)
+            self.FONT_NORMAL = _dialog_font(font_family, 14)
+            self.FONT_BOLD = _dialog_font(font_family, 14, "bold")
+            self.FONT_HEADER = _dialog_font(font_family, 22, "bold")
+            self.FONT_SMALL = _dialog_font(font_family, 11)
         
         # Window configuration
         self.title("เลือกโฟลเดอร์ปลายทาง")
-        self.geometry("550x320")
+        # Center on screen (screen size needs no pending idle tasks)
+        sw, sh = screen_size(parent)
+        x = (sw - 550) // 2
+        y = (sh - 320) // 2
+        self.geometry(f"550x320+{x}+{y}")
         self.resizable(False, False)
         self.transient(parent)
         self.grab_set()
         
-        # Center on screen
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - 550) // 2
-        y = (self.winfo_screenheight() - 320) // 2
-        self.geometry(f"550x320+{x}+{y}")
-        
         self.protocol("WM_DELETE_WINDOW", self._on_cancel)
         self._build_ui()
     
@@ -157,6 +234,8 @@ class FirstRunPathDialog(ctk.CTkToplevel):
     
     def _browse(self) -> None:
         """Open folder selection dialog."""
+        from tkinter import filedialog
+        
         default = os.path.join(os.path.expanduser("~"), "Music")
         folder = filedialog.askdirectory(
             title="เลือกโฟลเดอร์ปลายทาง",
@@ -164,10 +243,7 @@ class FirstRunPathDialog(ctk.CTkToplevel):
         )
         if folder:
             self.selected_path = folder
-            self.path_entry.configure(state="normal")
-            self.path_entry.delete(0, "end")
-            self.path_entry.insert(0, folder)
-            self.path_entry.configure(state="readonly")
+            update_readonly_entry(self.path_entry, folder)
             self.confirm_btn.configure(state="normal")
     
     def _confirm(self) -> None:
@@ -179,12 +255,13 @@ class FirstRunPathDialog(ctk.CTkToplevel):
     
     def _on_cancel(self) -> None:
         """Handle dialog close attempt."""
+        from tkinter import messagebox
+        
         if messagebox.askyesno(
             "ปิดโปรแกรม?",
             "ต้องเลือกโฟลเดอร์ก่อน\nต้องการปิดโปรแกรมหรือไม่?"
         ):
-            self.destroy()
-            os._exit(0)
+            _exit_app(self)
 
 
 class DependencySetupDialog(ctk.CTkToplevel):
@@ -215,34 +292,42 @@ class DependencySetupDialog(ctk.CTkToplevel):
         
         self.on_complete = on_complete
         self.cancelled = False
+        self._status_lock = threading.Lock()
+        self._pending_status: Tuple[str, str, float | None] | None = None
+        # Values currently on screen (Tk thread only)
+        self._shown_status: str | None = None
+        self._shown_detail: str | None = None
+        self._shown_progress: float | None = None
+        # Per-download completion (0..1), merged into one progress bar
+        self._slots: Dict[str, float] = {}
+        self._status_scheduled = False
         
-        # Font configuration
+        # Font configuration (shared CTkFont objects)
         if is_custom:
-            self.FONT_NORMAL = (font_family, 18)
-            self.FONT_HEADER = (font_family, 28, "bold")
-            self.FONT_SUBTITLE = (font_family, 15)
-            self.FONT_SMALL = (font_family, 14)
+            self.FONT_NORMAL = _dialog_font(font_family, 18)
+            self.FONT_HEADER = _dialog_font(font_family, 28, "bold")
+            self.FONT_SUBTITLE = _dialog_font(font_family, 15)
+            self.FONT_SMALL = _dialog_font(font_family, 14)
         else:
-            self.FONT_NORMAL = (font_family, 14)
-            self.FONT_HEADER = (font_family, 22, "bold")
-            self.FONT_SUBTITLE = (font_family, 12)
-            self.FONT_SMALL = (font_family, 11)
+            self.FONT_NORMAL = _dialog_font(font_family, 14)
+            self.FONT_HEADER = _dialog_font(font_family, 22, "bold")
+            self.FONT_SUBTITLE = _dialog_font(font_family, 12)
+            self.FONT_SMALL = _dialog_font(font_family, 11)
         
         # Window configuration
         self.title("กำลังติดตั้งระบบ...")
-        self.geometry("520x280")
+        # Center on screen (screen size needs no pending idle tasks)
+        sw, sh = screen_size(parent)
+        x = (sw - 520) // 2
+        y = (sh - 280) // 2
+        self.geometry(f"520x280+{x}+{y}")
         self.resizable(False, False)
         self.transient(parent)
         self.grab_set()
         
-        # Center on screen
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() - 520) // 2
-        y = (self.winfo_screenheight() - 280) // 2
-        self.geometry(f"520x280+{x}+{y}")
-        
         self.protocol("WM_DELETE_WINDOW", self._on_force_close)
         self._build_ui()
+        self._session = self._create_session()
         self.after(100, self._start_setup)
     
     def _build_ui(self) -> None:
@@ -284,50 +369,130 @@ class DependencySetupDialog(ctk.CTkToplevel):
         )
         self.detail_label.pack(pady=10)
     
+    @staticmethod
+    def _create_session():
+        """
+        Create a pooled HTTP session and pre-connect to both download hosts.
+        
+        The HEAD requests run on a daemon thread so the TCP + TLS
+        handshakes overlap with the dialog appearing; the downloads then
+        reuse the kept-alive connections.
+        
+        Returns:
+            requests.Session: Session shared by both download workers
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib.parse import urlsplit
+        
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        
+        def warm_up() -> None:
+            for url in (YTDLP_DOWNLOAD_URL, FFMPEG_DOWNLOAD_URL):
+                parts = urlsplit(url)
+                try:
+                    session.head(f"{parts.scheme}://{parts.netloc}", timeout=5)
+                except requests.RequestException:
+                    pass
+        
+        threading.Thread(target=warm_up, daemon=True).start()
+        return session
+    
     def _update_status(
         self,
         status: str,
         detail: str = "",
         progress: float | None = None
     ) -> None:
-        """Update status display (thread-safe)."""
-        self.after(0, lambda: self.status_label.configure(text=status))
-        self.after(0, lambda: self.detail_label.configure(text=detail))
-        if progress is not None:
-            self.after(0, lambda: self.progress_bar.set(progress))
+        """Update status display (thread-safe, coalesced)."""
+        # Both download workers report concurrently
+        with self._status_lock:
+            if progress is None and self._pending_status is not None:
+                progress = self._pending_status[2]
+            self._pending_status = (status, detail, progress)
+            if self._status_scheduled:
+                return
+            self._status_scheduled = True
+        self.after_idle(self._apply_status)
+    
+    def _slot_progress(self, slot: str, fraction: float) -> float:
+        """
+        Record one download's completion and return the overall progress.
+        
+        Each concurrent download owns an equal share of the bar, so the
+        workers never overwrite each other's position.
+        
+        Args:
+            slot: Download name registered in _start_setup
+            fraction: Completion of that download (0..1)
+            
+        Returns:
+            float: Overall bar position (0.05..0.95)
+        """
+        with self._status_lock:
+            self._slots[slot] = fraction
+            return 0.05 + 0.9 * sum(self._slots.values()) / len(self._slots)
+    
+    def _apply_status(self) -> None:
+        """Apply the latest pending status update (Tk main thread)."""
+        with self._status_lock:
+            pending = self._pending_status
+            self._pending_status = None
+            self._status_scheduled = False
+        if pending is None:
+            return
+        status, detail, progress = pending
+        # Only touch widgets whose value actually changed
+        if status != self._shown_status:
+            self._shown_status = status
+            self.status_label.configure(text=status)
+        if detail != self._shown_detail:
+            self._shown_detail = detail
+            self.detail_label.configure(text=detail)
+        if progress is not None and progress != self._shown_progress:
+            self._shown_progress = progress
+            self.progress_bar.set(progress)
     
     def _on_force_close(self) -> None:
         """Handle force close attempt."""
+        from tkinter import messagebox
+        
         if messagebox.askyesno(
             "ปิดโปรแกรม?",
             "การติดตั้งยังไม่เสร็จ\nต้องการปิดหรือไม่?"
         ):
             self.cancelled = True
-            self.destroy()
-            os._exit(0)
+            _exit_app(self)
     
     @run_in_thread
     def _start_setup(self) -> None:
         """Start the setup process in background thread."""
         try:
-            os.makedirs(ENGINE_DIR, exist_ok=True)
+            ensure_engine_dir()
             
-            # Download yt-dlp
-            if not os.path.exists(YTDLP_PATH):
+            # Both are I/O-bound fetches from different hosts: run concurrently
+            jobs = []
+            if not engine_has(os.path.basename(YTDLP_PATH)):
+                self._slots["yt-dlp"] = 0.0
                 self._update_status("📥 ดาวน์โหลด yt-dlp.exe...", "จาก GitHub", 0.05)
-                if not self._download_file(YTDLP_DOWNLOAD_URL, YTDLP_PATH, "yt-dlp"):
-                    return
-            self._update_status("✅ yt-dlp.exe พร้อม", "", 0.4)
+                jobs.append((
+                    self._download_file,
+                    (YTDLP_DOWNLOAD_URL, YTDLP_PATH, "yt-dlp", YTDLP_SHA256_URL)
+                ))
+            if not engine_has(os.path.basename(FFMPEG_PATH)):
+                self._slots["FFmpeg"] = 0.0
+                self._update_status("📥 ดาวน์โหลด FFmpeg...", "~80MB", 0.05)
+                jobs.append((self._download_and_extract_ffmpeg, ()))
             
-            if self.cancelled:
-                return
-            
-            # Download FFmpeg
-            if not os.path.exists(FFMPEG_PATH):
-                self._update_status("📥 ดาวน์โหลด FFmpeg...", "~80MB", 0.45)
-                if not self._download_and_extract_ffmpeg():
+            for ok, error in _run_daemon_jobs(jobs):
+                if error is not None:
+                    self.cancelled = True
+                    raise error
+                if not ok:
+                    # Abort the other download; status already shows the error
+                    self.cancelled = True
                     return
-            self._update_status("✅ ffmpeg.exe พร้อม", "", 0.95)
             
             if self.cancelled:
                 return
@@ -339,69 +504,213 @@ class DependencySetupDialog(ctk.CTkToplevel):
             self._update_status(f"❌ Error: {str(e)}", "", 0)
             self.after(4000, lambda: self._finish(False))
     
-    def _download_file(self, url: str, dest: str, name: str) -> bool:
-        """Download a file with progress updates."""
+    def _fetch_sha256(self, sums_url: str, filename: str) -> str | None:
+        """
+        Get the published SHA-256 of a download (best effort).
+        
+        Accepts both a bare "<hash>" file and a "<hash>  <name>" list.
+        
+        Args:
+            sums_url: URL of the checksum file
+            filename: Name of the file to look up in a checksum list
+            
+        Returns:
+            str | None: Lower-case hex digest, or None if unavailable
+        """
+        try:
+            with self._session.get(sums_url, timeout=15) as resp:
+                resp.raise_for_status()
+                text = resp.text
+        except Exception:
+            return None
+        for line in text.splitlines():
+            parts = line.split()
+            if len(parts) == 1 or (len(parts) >= 2 and parts[-1].lstrip('*') == filename):
+                if len(parts[0]) == 64:
+                    return parts[0].lower()
+        return None
+    
+    def _verify_sha256(self, digest: str, sums_url: str, filename: str) -> bool:
+        """
+        Compare a computed digest with the published one.
+        
+        A checksum that cannot be fetched does not block the install;
+        only a published checksum that differs fails it.
+        
+        Args:
+            digest: Hex digest computed while downloading
+            sums_url: URL of the checksum file
+            filename: Name of the file to look up in a checksum list
+            
+        Returns:
+            bool: False only on a definite mismatch
+        """
+        expected = self._fetch_sha256(sums_url, filename)
+        if expected is None or expected == digest:
+            return True
+        self._update_status(f"❌ ไฟล์เสียหาย: {filename}", "SHA-256 ไม่ตรงกัน", 0)
+        return False
+    
+    def _download_file(
+        self,
+        url: str,
+        dest: str,
+        name: str,
+        sums_url: str | None = None
+    ) -> bool:
+        """Download a file with progress updates (SHA-256 checked if sums_url)."""
+        import hashlib
+        
         try:
-            resp = requests.get(url, stream=True, timeout=60)
-            resp.raise_for_status()
-            total = int(resp.headers.get('content-length', 0))
-            downloaded = 0
+            # Hashed in the write loop: no second read of the file
+            sha = hashlib.sha256()
+            # Context-managed: the pooled connection is released right away
+            with self._session.get(url, stream=True, timeout=60) as resp:
+                resp.raise_for_status()
+                total = int(resp.headers.get('content-length', 0))
+                downloaded = 0
+                last_ui = 0.0
+                
+                # 1MB chunks: cancel is checked once per megabyte
+                with open(dest, 'wb', buffering=1 << 20) as f:
+                    for chunk in resp.iter_content(1 << 20):
+                        if self.cancelled:
+                            break
+                        f.write(chunk)
+                        sha.update(chunk)
+                        downloaded += len(chunk)
+                        if total > 0:
+                            now = time.monotonic()
+                            if now - last_ui > UI_UPDATE_INTERVAL or downloaded >= total:
+                                last_ui = now
+                                mb = downloaded / (1024*1024)
+                                self._update_status(
+                                    f"📥 {name}...",
+                                    f"{mb:.1f} MB",
+                                    self._slot_progress(name, downloaded / total)
+                                )
             
-            with open(dest, 'wb') as f:
-                for chunk in resp.iter_content(8192):
-                    if self.cancelled:
-                        return False
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total > 0:
-                        mb = downloaded / (1024*1024)
-                        self._update_status(f"📥 {name}...", f"{mb:.1f} MB")
+            if self.cancelled:
+                # Don't leave a truncated binary that looks installed
+                self._remove_partial(dest)
+                return False
+            if sums_url and not self._verify_sha256(
+                sha.hexdigest(), sums_url, os.path.basename(dest)
+            ):
+                self._remove_partial(dest)
+                return False
             return True
             
         except Exception as e:
             self._update_status(f"❌ ล้มเหลว: {e}", "", 0)
+            self._remove_partial(dest)
             return False
     
+    @staticmethod
+    def _remove_partial(path: str) -> None:
+        """Remove a partially downloaded file, ignoring errors."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
     def _download_and_extract_ffmpeg(self) -> bool:
-        """Download and extract FFmpeg from ZIP."""
+        """Download FFmpeg ZIP to a temp file and extract the binaries."""
+        import hashlib
+        import tempfile
+        
+        tmp_path = None
+        sha = hashlib.sha256()
         try:
-            resp = requests.get(FFMPEG_DOWNLOAD_URL, stream=True, timeout=180)
-            resp.raise_for_status()
-            total = int(resp.headers.get('content-length', 0))
-            downloaded = 0
-            chunks = []
+            with self._session.get(FFMPEG_DOWNLOAD_URL, stream=True, timeout=180) as resp:
+                resp.raise_for_status()
+                total = int(resp.headers.get('content-length', 0))
+                downloaded = 0
+                last_ui = 0.0
+                
+                # Stream to disk instead of buffering the ~80MB archive in RAM
+                with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp:
+                    tmp_path = tmp.name
+                    for chunk in resp.iter_content(1 << 20):
+                        if self.cancelled:
+                            return False
+                        tmp.write(chunk)
+                        sha.update(chunk)
+                        downloaded += len(chunk)
+                        if total > 0:
+                            now = time.monotonic()
+                            if now - last_ui > UI_UPDATE_INTERVAL or downloaded >= total:
+                                last_ui = now
+                                # Download is 90% of this slot, extraction the rest
+                                pct = downloaded / total
+                                self._update_status(
+                                    "📥 FFmpeg...",
+                                    f"{downloaded//(1024*1024)} MB",
+                                    self._slot_progress("FFmpeg", pct * 0.9)
+                                )
             
-            for chunk in resp.iter_content(65536):
-                if self.cancelled:
-                    return False
-                chunks.append(chunk)
-                downloaded += len(chunk)
-                if total > 0:
-                    pct = downloaded / total
-                    self._update_status(
-                        "📥 FFmpeg...",
-                        f"{downloaded//(1024*1024)} MB",
-                        0.45 + (pct * 0.4)
-                    )
+            if not self._verify_sha256(
+                sha.hexdigest(), FFMPEG_SHA256_URL, FFMPEG_DOWNLOAD_URL.rsplit('/', 1)[-1]
+            ):
+                return False
             
-            self._update_status("📦 แตกไฟล์...", "", 0.88)
-            zip_data = b''.join(chunks)
+            self._update_status("📦 แตกไฟล์...", "", self._slot_progress("FFmpeg", 0.9))
             
-            with zipfile.ZipFile(io.BytesIO(zip_data)) as zf:
-                for name in zf.namelist():
-                    nl = name.lower()
-                    if nl.endswith('ffmpeg.exe'):
-                        with zf.open(name) as s, open(FFMPEG_PATH, 'wb') as d:
-                            shutil.copyfileobj(s, d)
-                    elif nl.endswith('ffprobe.exe'):
-                        with zf.open(name) as s, open(FFPROBE_PATH, 'wb') as d:
-                            shutil.copyfileobj(s, d)
+            self._extract_ffmpeg(tmp_path)
+            
+            # One collection after the large transient buffers of the
+            # download/inflate, before the main window takes over
+            import gc
+            gc.collect()
             
             return os.path.exists(FFMPEG_PATH)
             
         except Exception as e:
             self._update_status(f"❌ FFmpeg ล้มเหลว: {e}", "", 0)
             return False
+        finally:
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _extract_ffmpeg(zip_path: str) -> None:
+        """
+        Extract ffmpeg.exe and ffprobe.exe from the downloaded archive.
+        
+        The ZIP central directory sits at the end of the file, so
+        extraction cannot start before the download finishes. Instead
+        the two members are inflated in parallel (zlib releases the GIL),
+        each thread using its own ZipFile handle.
+        """
+        import shutil
+        import zipfile
+        
+        # Single pass over the central directory, stopping once both are found
+        wanted = {"ffmpeg.exe": FFMPEG_PATH, "ffprobe.exe": FFPROBE_PATH}
+        targets = {}
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in zf.infolist():
+                dest = wanted.pop(info.filename.rsplit('/', 1)[-1].lower(), None)
+                if dest:
+                    targets[info.filename] = dest
+                    if not wanted:
+                        break
+        
+        def extract(member: str, dest: str) -> None:
+            with zipfile.ZipFile(zip_path) as zf:
+                with zf.open(member) as s, open(dest, 'wb') as d:
+                    shutil.copyfileobj(s, d, 1 << 20)
+        
+        errors = [
+            error
+            for _, error in _run_daemon_jobs([(extract, item) for item in targets.items()])
+            if error is not None
+        ]
+        if errors:
+            raise errors[0]
     
     def _finish(self, success: bool) -> None:
         """Complete the setup process."""
@@ -6,127 +6,111 @@
 ║  📋 Right-Click Context Menu (Cut/Copy/Paste/Select All)                     ║
 ║  🌐 Hardware Keycode Bindings (Works with Thai/English keyboard)             ║
 ║  🔧 Language-Independent Shortcuts via Virtual Events                        ║
+║  🧩 One Shared Menu via Class-Level Bindings (bind_class)                    ║
+║  🔔 Non-blocking Toast Notifications                                         ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
 import tkinter as tk
-from typing import Tuple, Any
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import customtkinter as ctk
 
 
 def select_all(entry_widget: Any) -> str:
     """
-    Select all text in an entry widget.
+    Select all text in an entry (or text) widget.
     
     Args:
-        entry_widget: The tkinter entry widget
+        entry_widget: The tkinter Entry or Text widget
         
     Returns:
         str: "break" to prevent default behavior
     """
     try:
-        entry_widget.select_range(0, "end")
-        entry_widget.icursor("end")
+        if isinstance(entry_widget, tk.Text):
+            entry_widget.tag_add("sel", "1.0", "end-1c")
+            entry_widget.mark_set("insert", "end")
+        else:
+            entry_widget.select_range(0, "end")
+            entry_widget.icursor("end")
     except Exception:
         pass
     return "break"
 
 
-def create_context_menu(
-    widget: ctk.CTkEntry,
+# Ctrl+<key> handlers by Windows virtual keycode: A=65, C=67, V=86, X=88
+_CTRL_HANDLERS: Dict[int, Callable[[Any], Any]] = {
+    65: select_all,                                   # Select All
+    67: lambda w: w.event_generate("<<Copy>>"),       # Copy
+    86: lambda w: w.event_generate("<<Paste>>"),      # Paste
+    88: lambda w: w.event_generate("<<Cut>>"),        # Cut
+}
+
+
+def _ctrl_dispatch(event: tk.Event) -> Optional[str]:
+    """
+    Handle Ctrl+Key shortcuts using hardware keycodes.
+    Works regardless of keyboard language layout.
+    
+    One module-level handler shared by every binding; it acts on
+    event.widget, so no per-widget closure is needed.
+    """
+    handler = _CTRL_HANDLERS.get(event.keycode)
+    if handler is None:
+        return None  # Let other keys pass through
+    handler(event.widget)
+    return "break"
+
+
+def install_global_context_menu(
+    root: Any,
     font: Tuple[str, int] = ("Tahoma", 14)
 ) -> None:
     """
-    Create a right-click context menu for a CTkEntry widget.
+    Install one shared context menu + smart shortcuts for every text field.
     
-    Features:
-    - Cut/Copy/Paste/Select All with Thai labels
-    - Works with any keyboard layout (Thai/English)
-    - Hardware keycode-based shortcuts (language independent)
+    Binds once at the Tk class level ("Entry" and "Text", which CTkEntry
+    and CTkTextbox wrap), so every current and future field in the app -
+    including dialogs - shares a single menu and a single handler instead
+    of a menu and closures per widget. The handlers act on event.widget.
     
     Args:
-        widget: The CTkEntry widget to attach the menu to
+        root: Application root window
         font: Font tuple for menu items (family, size)
-    
-    Example:
-        url_entry = ctk.CTkEntry(parent, ...)
-        create_context_menu(url_entry, font=("Tahoma", 14))
     """
-    # Create the context menu
-    context_menu = tk.Menu(widget, tearoff=0, font=font)
+    context_menu = tk.Menu(root, tearoff=0, font=font)
+    target = {"widget": None}
     
-    # Get the underlying tkinter entry widget from CTkEntry
-    try:
-        inner_entry = widget._entry  # CTkEntry internal reference
-    except AttributeError:
-        inner_entry = widget  # Fallback for standard Entry
-    
-    # Menu commands using virtual events (keyboard layout independent)
-    context_menu.add_command(
-        label="✂️  ตัด",
-        command=lambda: inner_entry.event_generate("<<Cut>>")
-    )
-    context_menu.add_command(
-        label="📄  คัดลอก",
-        command=lambda: inner_entry.event_generate("<<Copy>>")
-    )
-    context_menu.add_command(
-        label="📋  วาง",
-        command=lambda: inner_entry.event_generate("<<Paste>>")
-    )
+    def _send(virtual_event: str) -> None:
+        widget = target["widget"]
+        if widget is not None:
+            widget.event_generate(virtual_event)
+    
+    def _select_all() -> None:
+        if target["widget"] is not None:
+            select_all(target["widget"])
+    
+    context_menu.add_command(label="✂️  ตัด", command=lambda: _send("<<Cut>>"))
+    context_menu.add_command(label="📄  คัดลอก", command=lambda: _send("<<Copy>>"))
+    context_menu.add_command(label="📋  วาง", command=lambda: _send("<<Paste>>"))
     context_menu.add_separator()
-    context_menu.add_command(
-        label="✅  เลือกทั้งหมด",
-        command=lambda: select_all(inner_entry)
-    )
+    context_menu.add_command(label="✅  เลือกทั้งหมด", command=_select_all)
     
     def show_context_menu(event: tk.Event) -> None:
-        """Show context menu at cursor position."""
+        """Show the shared menu for the clicked field."""
+        target["widget"] = event.widget
         try:
-            inner_entry.focus_set()
+            event.widget.focus_set()
             context_menu.tk_popup(event.x_root, event.y_root)
         except Exception as e:
             print(f"⚠️ Context menu error: {e}")
         finally:
             context_menu.grab_release()
     
-    # Bind right-click event (Button-3 on Windows/Linux)
-    inner_entry.bind("<Button-3>", show_context_menu)
-    
-    # ═══════════════════════════════════════════════════════════════════════════
-    # 🌐 Smart Keyboard Shortcuts (Keycode-Based, Language Independent)
-    # ═══════════════════════════════════════════════════════════════════════════
-    # Uses hardware keycodes instead of characters so it works with
-    # ANY keyboard layout (Thai, English, Japanese, etc.)
-    
-    def handle_smart_shortcuts(event: tk.Event) -> str | None:
-        """
-        Handle Ctrl+Key shortcuts using hardware keycodes.
-        Works regardless of keyboard language layout.
-        
-        Windows Standard Keycodes:
-        A=65, C=67, V=86, X=88
-        """
-        keycode = event.keycode
-        
-        if keycode == 65:  # A key -> Select All
-            select_all(inner_entry)
-            return "break"
-        elif keycode == 67:  # C key -> Copy
-            inner_entry.event_generate("<<Copy>>")
-            return "break"
-        elif keycode == 86:  # V key -> Paste
-            inner_entry.event_generate("<<Paste>>")
-            return "break"
-        elif keycode == 88:  # X key -> Cut
-            inner_entry.event_generate("<<Cut>>")
-            return "break"
-        
-        return None  # Let other keys pass through
-    
-    # Bind generic Control-Key event to our smart handler
-    inner_entry.bind("<Control-Key>", handle_smart_shortcuts)
+    for widget_class in ("Entry", "Text"):
+        root.bind_class(widget_class, "<Button-3>", show_context_menu)
+        root.bind_class(widget_class, "<Control-Key>", _ctrl_dispatch)
 
 
 def create_readonly_entry(
@@ -161,9 +145,7 @@ def create_readonly_entry(
     )
     
     # Set initial text
-    entry.configure(state="normal")
-    entry.insert(0, text)
-    entry.configure(state="readonly")
+    update_readonly_entry(entry, text)
     
     return entry
 
@@ -172,11 +154,90 @@ def update_readonly_entry(entry: ctk.CTkEntry, text: str) -> None:
     """
     Update the text of a read-only entry widget.
     
+    Works on the inner tk.Entry directly, so the state toggles do not go
+    through CTkEntry.configure. While a placeholder is showing, the CTk
+    wrapper is used instead because it must clear the placeholder first.
+    
     Args:
         entry: The CTkEntry widget
         text: New text to display
     """
-    entry.configure(state="normal")
-    entry.delete(0, "end")
-    entry.insert(0, text)
-    entry.configure(state="readonly")
+    target = entry
+    if not getattr(entry, "_placeholder_text_active", False):
+        target = getattr(entry, "_entry", entry)
+    target.configure(state="normal")
+    target.delete(0, "end")
+    target.insert(0, text)
+    target.configure(state="readonly")
+
+
+# (width, height) of the screen, read once per process
+_screen_size: Optional[Tuple[int, int]] = None
+
+
+def screen_size(root: Any) -> Tuple[int, int]:
+    """
+    Get the screen size, cached after the first call.
+    
+    The screen does not change for the lifetime of the app, so dialogs
+    reuse the first answer instead of two Tcl round-trips per open.
+    
+    Args:
+        root: Any Tk widget
+        
+    Returns:
+        Tuple[int, int]: (width, height) in pixels
+    """
+    global _screen_size
+    if _screen_size is None:
+        _screen_size = (root.winfo_screenwidth(), root.winfo_screenheight())
+    return _screen_size
+
+
+def show_toast(
+    parent: Any,
+    title: str,
+    message: str,
+    font: Any = ("Tahoma", 14),
+    duration_ms: int = 2500,
+    width: int = 360,
+    height: int = 120
+) -> ctk.CTkToplevel:
+    """
+    Show a small notification window that closes itself.
+    
+    Unlike messagebox.showinfo, this does not start a nested modal
+    event loop, so progress redraws and queued callbacks keep running.
+    
+    Args:
+        parent: Parent window (toast is centered over it)
+        title: Window title
+        message: Text to display
+        font: Font for the message
+        duration_ms: Time before the toast destroys itself
+        width: Toast width in pixels
+        height: Toast height in pixels
+        
+    Returns:
+        CTkToplevel: The toast window
+    """
+    toast = ctk.CTkToplevel(parent)
+    toast.title(title)
+    toast.resizable(False, False)
+    toast.transient(parent)
+    
+    x = parent.winfo_rootx() + (parent.winfo_width() - width) // 2
+    y = parent.winfo_rooty() + (parent.winfo_height() - height) // 2
+    toast.geometry(f"{width}x{height}+{max(x, 0)}+{max(y, 0)}")
+    
+    label = ctk.CTkLabel(toast, text=message, font=font, wraplength=width - 40)
+    label.pack(expand=True, fill="both", padx=20, pady=20)
+    
+    def _close() -> None:
+        try:
+            toast.destroy()
+        except Exception:
+            pass
+    
+    toast.after(duration_ms, _close)
+    return toast
@@ -12,11 +12,19 @@ from .paths import (
     FFPROBE_PATH,
     YTDLP_DOWNLOAD_URL,
     FFMPEG_DOWNLOAD_URL,
+    YTDLP_SHA256_URL,
+    FFMPEG_SHA256_URL,
     APP_VERSION,
     UPDATE_JSON_URL,
     is_frozen,
+    scan_dir,
+    engine_has,
+    engine_present,
+    ensure_engine_dir,
 )
 from .fonts import FontLoader
+from .process import POPEN_KWARGS
+from .debug import DEBUG, debug_print
 
 __all__ = [
     "BASE_DIR",
@@ -28,8 +36,17 @@ __all__ = [
     "FFPROBE_PATH",
     "YTDLP_DOWNLOAD_URL",
     "FFMPEG_DOWNLOAD_URL",
+    "YTDLP_SHA256_URL",
+    "FFMPEG_SHA256_URL",
     "APP_VERSION",
     "UPDATE_JSON_URL",
     "is_frozen",
+    "scan_dir",
+    "engine_has",
+    "engine_present",
+    "ensure_engine_dir",
     "FontLoader",
+    "POPEN_KWARGS",
+    "DEBUG",
+    "debug_print",
 ]
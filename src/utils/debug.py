@@ -0,0 +1,25 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        DEBUG OUTPUT MODULE                                   ║
+║              Opt-in Diagnostic Printing (INFINITY_DEBUG=1)                   ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║  🔇 Silent by default (no console writes/emoji encoding on startup)          ║
+║  🐛 Set INFINITY_DEBUG=1 to see diagnostics                                  ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+import sys
+
+
+DEBUG: bool = os.environ.get("INFINITY_DEBUG") == "1"
+
+
+def debug_print(*args, **kwargs) -> None:
+    """
+    print() that only writes when DEBUG is enabled.
+    
+    Also a no-op when there is no stdout (pythonw.exe / windowed build).
+    """
+    if DEBUG and sys.stdout is not None:
+        print(*args, **kwargs)
@@ -10,11 +10,13 @@
 """
 
 import os
-from typing import Tuple, List
+import tkinter.font as tkfont
+from typing import Tuple, List, Optional, Set
 
 import customtkinter as ctk
 
-from .paths import FONT_DIR
+from .paths import FONT_DIR, scan_dir
+from .debug import debug_print
 
 
 class FontLoader:
@@ -27,6 +29,9 @@ class FontLoader:
     Usage:
         app = ctk.CTk()  # Create window first
         font_family, is_custom = FontLoader.load()  # Then load fonts
+        
+    Pass the family returned by a previous launch as ``preferred`` to
+    skip the fallback probe entirely.
     """
     
     # Thai-compatible fallback fonts (in priority order)
@@ -37,21 +42,47 @@ class FontLoader:
     _font_family: str = "Tahoma"
     _is_custom: bool = False
     
+    # Font files already registered with the OS (survives reset(): a
+    # registered font stays available for the rest of the process)
+    _registered: Set[str] = set()
+    
+    @staticmethod
+    def _is_available(family: str) -> bool:
+        """
+        Check whether Tk resolves a family to itself (not a substitute).
+        
+        Args:
+            family: Font family name to probe
+            
+        Returns:
+            bool: True if the family is installed
+        """
+        try:
+            actual = tkfont.Font(family=family, size=14).actual("family")
+            return actual.lower() == family.lower()
+        except Exception:
+            return False
+    
     @classmethod
-    def load(cls) -> Tuple[str, bool]:
+    def load(cls, preferred: Optional[str] = None) -> Tuple[str, bool]:
         """
         Load fonts - MUST be called after root window is created.
         
+        Args:
+            preferred: Known-good fallback family from a previous run.
+                If it is one of SAFE_THAI_FONTS, the probe loop is skipped.
+        
         Returns:
             Tuple[str, bool]: (font_family_name, is_custom_font)
         """
         if cls._loaded:
             return (cls._font_family, cls._is_custom)
         
-        print("\n🔤 === Font Health Check ===")
+        debug_print("\n🔤 === Font Health Check ===")
         
-        # Step 1: Try to load Custom Font
-        if os.path.exists(FONT_DIR):
+        # Step 1: Try to load Custom Font (one scandir instead of per-file stats)
+        present = scan_dir(FONT_DIR)
+        if present:
             font_files = [
                 ("THSarabunNew.ttf", "Regular"),
                 ("THSarabunNew Bold.ttf", "Bold"),
@@ -59,47 +90,55 @@ class FontLoader:
             
             loaded = 0
             for filename, variant in font_files:
-                filepath = os.path.join(FONT_DIR, filename)
-                if os.path.exists(filepath):
-                    try:
-                        ctk.FontManager.load_font(filepath)
+                if filename.lower() not in present:
+                    continue
+                if filename in cls._registered:
+                    loaded += 1
+                    continue
+                try:
+                    # load_font reports failure via its return value
+                    if ctk.FontManager.load_font(os.path.join(FONT_DIR, filename)):
+                        cls._registered.add(filename)
                         loaded += 1
-                        print(f"✓ Loaded {variant}: {filename}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to load {filename}: {e}")
+                        debug_print(f"✓ Loaded {variant}: {filename}")
+                    else:
+                        debug_print(f"⚠️ Failed to load {filename}")
+                except Exception as e:
+                    debug_print(f"⚠️ Failed to load {filename}: {e}")
             
             if loaded > 0:
-                # Test if the font is actually usable
-                try:
-                    test = ctk.CTkFont(family="TH Sarabun New", size=14)
-                    if test:
-                        cls._font_family = "TH Sarabun New"
-                        cls._is_custom = True
-                        cls._loaded = True
-                        print("✅ Using font: TH Sarabun New")
-                        print("=" * 35 + "\n")
-                        return (cls._font_family, cls._is_custom)
-                except Exception as e:
-                    print(f"⚠️ Font loaded but not usable: {e}")
+                # Registered with the OS: trust it instead of building a
+                # throwaway CTkFont (a full metrics query) as a probe
+                cls._font_family = "TH Sarabun New"
+                cls._is_custom = True
+                cls._loaded = True
+                debug_print("✅ Using font: TH Sarabun New")
+                debug_print("=" * 35 + "\n")
+                return (cls._font_family, cls._is_custom)
+        
+        # Step 2: Reuse the family memoized by a previous launch
+        if preferred in cls.SAFE_THAI_FONTS:
+            cls._font_family = preferred
+            cls._is_custom = False
+            cls._loaded = True
+            debug_print(f"🔄 Using cached fallback font: {preferred}")
+            debug_print("=" * 35 + "\n")
+            return (cls._font_family, cls._is_custom)
         
-        # Step 2: Use Fallback Fonts
+        # Step 3: Probe Fallback Fonts (stop at first installed family)
         for font_name in cls.SAFE_THAI_FONTS:
-            try:
-                test = ctk.CTkFont(family=font_name, size=14)
-                if test:
-                    cls._font_family = font_name
-                    cls._is_custom = False
-                    cls._loaded = True
-                    print(f"🔄 Using fallback font: {font_name}")
-                    print("=" * 35 + "\n")
-                    return (cls._font_family, cls._is_custom)
-            except Exception:
-                continue
+            if cls._is_available(font_name):
+                cls._font_family = font_name
+                cls._is_custom = False
+                cls._loaded = True
+                debug_print(f"🔄 Using fallback font: {font_name}")
+                debug_print("=" * 35 + "\n")
+                return (cls._font_family, cls._is_custom)
         
-        # Step 3: Default fallback
+        # Step 4: Default fallback
         cls._loaded = True
-        print("⚠️ Using default font: Tahoma")
-        print("=" * 35 + "\n")
+        debug_print("⚠️ Using default font: Tahoma")
+        debug_print("=" * 35 + "\n")
         return ("Tahoma", False)
     
     @classmethod
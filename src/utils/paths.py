@@ -9,8 +9,12 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 """
 
+import functools
 import os
 import sys
+from typing import FrozenSet, Optional, Set, Tuple
+
+from .debug import debug_print
 
 
 def is_frozen() -> bool:
@@ -54,8 +58,15 @@ FONT_DIR: str = os.path.join(BASE_DIR, "font")
 ICON_DIR: str = os.path.join(BASE_DIR, "icon")
 SETTINGS_FILE: str = os.path.join(BASE_DIR, "settings.json")
 
-# Ensure critical directories exist
-os.makedirs(ENGINE_DIR, exist_ok=True)
+
+def ensure_engine_dir() -> None:
+    """
+    Create ENGINE_DIR if it does not exist yet.
+    
+    Called by the code paths that write into it, instead of a mkdir on
+    every import; readers already treat a missing directory as empty.
+    """
+    os.makedirs(ENGINE_DIR, exist_ok=True)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -74,6 +85,10 @@ FFPROBE_PATH: str = os.path.join(ENGINE_DIR, "ffprobe.exe")
 YTDLP_DOWNLOAD_URL: str = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/yt-dlp.exe"
 FFMPEG_DOWNLOAD_URL: str = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
 
+# Published SHA-256 checksums for the downloads above
+YTDLP_SHA256_URL: str = "https://github.com/yt-dlp/yt-dlp/releases/latest/download/SHA2-256SUMS"
+FFMPEG_SHA256_URL: str = FFMPEG_DOWNLOAD_URL + ".sha256"
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # 🔄 APP VERSION & UPDATE CONFIGURATION
@@ -83,10 +98,86 @@ APP_VERSION: str = "3.3.1"
 UPDATE_JSON_URL: str = "https://raw.githubusercontent.com/ThanathonTH/Weera_Program/main/version.json"
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# 🔍 DIRECTORY SCAN
+# ══════════════════════════════════════════════════════════════════════════════
+
+def scan_dir(path: str) -> Set[str]:
+    """
+    List the entries of a directory in a single scandir call.
+    
+    Replaces a series of per-file os.path.exists() checks (one stat
+    syscall each) with one directory read.
+    
+    Args:
+        path: Directory to scan
+    
+    Returns:
+        Set[str]: Lower-cased entry names, empty if the directory is missing
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name.lower() for entry in it}
+    except OSError:
+        return set()
+
+
+# (ENGINE_DIR st_mtime_ns, entries) of the last scan
+_engine_cache: Tuple[Optional[int], FrozenSet[str]] = (None, frozenset())
+
+
+def engine_present() -> FrozenSet[str]:
+    """
+    Get the set of files currently in ENGINE_DIR.
+    
+    The scan is cached against the directory's mtime, which changes
+    whenever an entry is created, removed or renamed in it, so repeated
+    checks cost one stat call instead of a directory read.
+    
+    Returns:
+        FrozenSet[str]: Lower-cased file names (e.g. {"yt-dlp.exe", "ffmpeg.exe"})
+    """
+    global _engine_cache
+    try:
+        mtime = os.stat(ENGINE_DIR).st_mtime_ns
+    except OSError:
+        return frozenset()
+    cached_mtime, entries = _engine_cache
+    if mtime != cached_mtime:
+        entries = frozenset(scan_dir(ENGINE_DIR))
+        _engine_cache = (mtime, entries)
+    return entries
+
+
+def engine_has(filename: str) -> bool:
+    """
+    Check whether ENGINE_DIR contains a file.
+    
+    Only a hit in the engine_present() scan is trusted. A miss is
+    confirmed with os.path.exists(): directory mtimes can be too coarse
+    (FAT32 keeps 2-second write times) to show a file created right
+    after the scan. A stale miss drops the cached scan.
+    
+    Args:
+        filename: File name inside ENGINE_DIR (e.g. "yt-dlp.exe")
+    
+    Returns:
+        bool: True if the file exists
+    """
+    global _engine_cache
+    if filename.lower() in engine_present():
+        return True
+    if os.path.exists(os.path.join(ENGINE_DIR, filename)):
+        _engine_cache = (None, frozenset())
+        return True
+    return False
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 🎨 UI ICON PATH
 # ══════════════════════════════════════════════════════════════════════════════
 
+@functools.lru_cache(maxsize=1)
 def get_icon_path() -> str:
     """
     Get the path to the application icon.
@@ -98,8 +189,8 @@ def get_icon_path() -> str:
     return icon_path if os.path.exists(icon_path) else ""
 
 
-# Debug output on import (only in dev mode)
+# Debug output on import (only in dev mode with INFINITY_DEBUG=1)
 if not is_frozen():
-    print(f"📁 [paths.py] BASE_DIR: {BASE_DIR}")
-    print(f"📁 [paths.py] ENGINE_DIR: {ENGINE_DIR}")
-    print(f"📁 [paths.py] Mode: {'Frozen' if is_frozen() else 'Development'}")
+    debug_print(f"📁 [paths.py] BASE_DIR: {BASE_DIR}")
+    debug_print(f"📁 [paths.py] ENGINE_DIR: {ENGINE_DIR}")
+    debug_print(f"📁 [paths.py] Mode: {'Frozen' if is_frozen() else 'Development'}")
@@ -0,0 +1,34 @@
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      PROCESS SPAWN HELPERS                                   ║
+║              Hidden-Window Subprocess Options for Windows                    ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║  🙈 CREATE_NO_WINDOW + SW_HIDE (no console flash, no conhost init)           ║
+║  🐧 No-op on non-Windows platforms                                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import subprocess
+from typing import Any, Dict, Optional
+
+
+def _make_hidden_startupinfo() -> Optional[Any]:
+    """
+    Build a STARTUPINFO that hides the child's window.
+    
+    Returns:
+        subprocess.STARTUPINFO on Windows, None elsewhere
+    """
+    if not hasattr(subprocess, "STARTUPINFO"):
+        return None
+    si = subprocess.STARTUPINFO()
+    si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    si.wShowWindow = subprocess.SW_HIDE
+    return si
+
+
+# Shared keyword arguments for every background subprocess call
+POPEN_KWARGS: Dict[str, Any] = {
+    "creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    "startupinfo": _make_hidden_startupinfo(),
+}